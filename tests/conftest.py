@@ -1,77 +1,123 @@
 """Pytest configuration and shared fixtures."""
 
-import pytest
 import asyncio
-from typing import Generator
+import functools
+from types import MappingProxyType
+
+import httpx
+import pytest
+import pytest_asyncio
+from zbx_mcp_server.config import load_config
+from zbx_mcp_server.server import create_app
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop where it is available, without changing the process-wide policy."""
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Configuration loaded once per session; deepcopy it before mutating."""
+    return load_config()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_app():
+    """Build the FastAPI app once per test process."""
+    return create_app()
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def app():
+    """Shared FastAPI app instance."""
+    return _cached_app()
+
+
+@pytest_asyncio.fixture
+async def client(app):
+    """Async client driving the ASGI app in-process on the test event loop."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+# Read-only sample payloads, built once; copy with dict() before mutating.
+_SAMPLE_MCP_REQUEST = MappingProxyType({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": MappingProxyType({})
+})
+
+_SAMPLE_TOOL_CALL_REQUEST = MappingProxyType({
+    "jsonrpc": "2.0",
+    "id": 2,
+    "method": "tools/call",
+    "params": MappingProxyType({
+        "name": "echo",
+        "arguments": MappingProxyType({"message": "test message"})
+    })
+})
+
+_SAMPLE_SERVER_INFO = MappingProxyType({
+    "name": "test-server",
+    "version": "1.0.0"
+})
+
+_SAMPLE_INITIALIZE_RESULT = MappingProxyType({
+    "protocolVersion": "2024-11-05",
+    "capabilities": MappingProxyType({"tools": MappingProxyType({})}),
+    "serverInfo": _SAMPLE_SERVER_INFO
+})
+
+_SAMPLE_TOOL_DEFINITION = MappingProxyType({
+    "name": "test_tool",
+    "description": "A test tool",
+    "inputSchema": MappingProxyType({
+        "type": "object",
+        "properties": MappingProxyType({
+            "param1": MappingProxyType({"type": "string"}),
+            "param2": MappingProxyType({"type": "integer"})
+        }),
+        "required": ("param1",)
+    })
+})
 
 
 @pytest.fixture
 def sample_mcp_request():
     """Sample MCP request for testing."""
-    return {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "initialize",
-        "params": {}
-    }
+    return _SAMPLE_MCP_REQUEST
 
 
 @pytest.fixture
 def sample_tool_call_request():
     """Sample tool call request for testing."""
-    return {
-        "jsonrpc": "2.0",
-        "id": 2,
-        "method": "tools/call",
-        "params": {
-            "name": "echo",
-            "arguments": {"message": "test message"}
-        }
-    }
+    return _SAMPLE_TOOL_CALL_REQUEST
 
 
 @pytest.fixture
 def sample_server_info():
     """Sample server info for testing."""
-    return {
-        "name": "test-server",
-        "version": "1.0.0"
-    }
+    return _SAMPLE_SERVER_INFO
 
 
 @pytest.fixture
 def sample_initialize_result():
     """Sample initialize result for testing."""
-    return {
-        "protocolVersion": "2024-11-05",
-        "capabilities": {"tools": {}},
-        "serverInfo": {
-            "name": "test-server",
-            "version": "1.0.0"
-        }
-    }
+    return _SAMPLE_INITIALIZE_RESULT
 
 
 @pytest.fixture
 def sample_tool_definition():
     """Sample tool definition for testing."""
-    return {
-        "name": "test_tool",
-        "description": "A test tool",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "param1": {"type": "string"},
-                "param2": {"type": "integer"}
-            },
-            "required": ["param1"]
-        }
-    }
\ No newline at end of file
+    return _SAMPLE_TOOL_DEFINITION
@@ -0,0 +1,92 @@
+"""Tests for the in-memory TTL cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from zbx_mcp_server.cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_hit_until_expiry():
+    """Test that a value is reused until its TTL has passed."""
+    cache = TTLCache(ttl=30)
+    compute = AsyncMock(side_effect=["first", "second"])
+
+    with patch("zbx_mcp_server.cache.time.monotonic", return_value=100.0):
+        assert await cache.get_or_compute("key", compute) == "first"
+        assert await cache.get_or_compute("key", compute) == "first"
+
+    with patch("zbx_mcp_server.cache.time.monotonic", return_value=130.0):
+        assert await cache.get_or_compute("key", compute) == "second"
+    assert compute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_computation():
+    """Test that simultaneous misses for a key wait for a single computation."""
+    cache = TTLCache(ttl=30)
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(8)))
+    assert results == [1] * 8
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    """Test that a failed computation is retried on the next call."""
+    cache = TTLCache(ttl=30)
+    compute = AsyncMock(side_effect=[RuntimeError("unreachable"), "value"])
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("key", compute)
+    assert await cache.get_or_compute("key", compute) == "value"
+
+
+@pytest.mark.asyncio
+async def test_clear_discards_running_computation():
+    """Test that a result computed across clear() is returned but not stored."""
+    cache = TTLCache(ttl=30)
+
+    async def compute_and_clear():
+        cache.clear()
+        return "stale"
+
+    assert await cache.get_or_compute("key", compute_and_clear) == "stale"
+    assert await cache.get_or_compute("key", AsyncMock(return_value="fresh")) == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_maxsize_evicts_oldest():
+    """Test that a full cache drops its oldest entry to make room."""
+    cache = TTLCache(ttl=30, maxsize=2)
+    for key in ("a", "b", "c"):
+        await cache.get_or_compute(key, AsyncMock(return_value=key))
+
+    compute = AsyncMock(return_value="recomputed")
+    assert await cache.get_or_compute("c", compute) == "c"
+    assert await cache.get_or_compute("a", compute) == "recomputed"
+
+
+@pytest.mark.asyncio
+async def test_locks_are_released():
+    """Test that per-key locks do not outlive the calls that use them."""
+    cache = TTLCache(ttl=30, maxsize=2)
+    for key in range(10):
+        await cache.get_or_compute(key, AsyncMock(return_value=key))
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        return "value"
+
+    await asyncio.gather(*(cache.get_or_compute("shared", compute) for _ in range(4)))
+    assert cache._locks == {}
+    assert cache._lock_users == {}
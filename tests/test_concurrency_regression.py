@@ -0,0 +1,43 @@
+"""Regression guard: tool handlers must not block the event loop."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+CONCURRENT_REQUESTS = 64
+UPSTREAM_LATENCY = 0.05
+
+
+async def _slow_get_items(*args, **kwargs):
+    """Stand-in for a Zabbix round-trip that yields to the loop."""
+    await asyncio.sleep(UPSTREAM_LATENCY)
+    return [{"itemid": "1", "name": "CPU Utilization"}]
+
+
+@pytest.mark.perf
+@pytest.mark.asyncio
+async def test_loop_not_blocked(client):
+    """Concurrent tool calls overlap their upstream waits instead of serializing."""
+    request_data = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {
+            # Not a cached tool, so every call reaches the handler
+            "name": "zabbix_get_items",
+            "arguments": {}
+        }
+    }
+
+    with patch("zbx_mcp_server.zabbix_client.ZabbixClient.get_items", new=_slow_get_items):
+        t0 = time.perf_counter()
+        responses = await asyncio.gather(
+            *(client.post("/", json=request_data) for _ in range(CONCURRENT_REQUESTS))
+        )
+        elapsed = time.perf_counter() - t0
+
+    assert all("result" in response.json() for response in responses)
+    # Serialized handlers would take CONCURRENT_REQUESTS * UPSTREAM_LATENCY
+    assert elapsed < CONCURRENT_REQUESTS * UPSTREAM_LATENCY / 4
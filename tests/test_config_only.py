@@ -1,123 +1,128 @@
 #!/usr/bin/env python3
 """Test suite for distributed Zabbix server management functionality."""
 
-from zbx_mcp_server.config import load_config
+import dataclasses
+
+import orjson
+import pytest
+
+from zbx_mcp_server.config import get_server_config, load_config
 from zbx_mcp_server.server_manager import ZabbixServerManager
-import json
 
 
-def test_distributed_config_loading():
+OLD_STYLE_CONFIG = {
+    "zabbix": {
+        "url": "http://localhost:8080",
+        "username": "Admin",
+        "password": "zabbix",
+        "timeout": 30,
+        "verify_ssl": False
+    },
+    "server": {
+        "host": "0.0.0.0",
+        "port": 8000,
+        "log_level": "INFO"
+    }
+}
+
+NODE_IDS = list(load_config().zabbix_servers)
+
+
+def test_distributed_config_loading(config):
     """Test distributed Zabbix server configuration loading."""
-    print("=== Testing Distributed Configuration Loading ===")
-    
-    try:
-        # Load configuration
-        config = load_config()
-        print(f"✓ Distributed configuration loaded successfully")
-        print(f"  - Number of distributed nodes: {len(config.zabbix_servers)}")
-        print(f"  - Default node: {config.default_zabbix_server}")
-        
-        # List node details
-        print("\n=== Distributed Node Details ===")
-        for node_id, node_config in config.zabbix_servers.items():
-            print(f"  {node_id}:")
-            print(f"    Name: {node_config.name}")
-            print(f"    URL: {node_config.url}")
-            print(f"    Description: {node_config.description}")
-            print(f"    Timeout: {node_config.timeout}s")
-            print(f"    SSL Enabled: {node_config.verify_ssl}")
-        
-        # Test distributed server manager initialization
-        print("\n=== Distributed Server Manager ===")
-        manager = ZabbixServerManager(config)
-        print(f"✓ Distributed server manager created successfully")
-        
-        # List distributed nodes
-        nodes = manager.list_servers()
-        print(f"✓ Distributed node list retrieved:")
-        for node_id, node_info in nodes.items():
-            print(f"  Node {node_id}:")
-            print(f"    Name: {node_info['name']}")
-            print(f"    Status: {node_info['status']}")
-            print(f"    Is Default: {node_info['is_default']}")
-            print(f"    SSL: {node_info['ssl_enabled']}")
-        
-        # Test node validation
-        print("\n=== Node Validation ===")
-        default_id = manager.validate_server_id(None)
-        print(f"✓ Default node ID: {default_id}")
-        
-        # Test with first available node
-        first_node = next(iter(config.zabbix_servers.keys()))
-        valid_id = manager.validate_server_id(first_node)
-        print(f"✓ Valid node ID '{first_node}': {valid_id}")
-        
-        try:
-            invalid_id = manager.validate_server_id("nonexistent-node")
-            print(f"✗ Invalid node test should have failed")
-        except ValueError as e:
-            print(f"✓ Invalid node correctly rejected: {e}")
-        
-        print("\n=== Distributed configuration tests passed! ===")
-        
-    except Exception as e:
-        print(f"✗ Distributed configuration test failed: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-def test_backward_compatibility():
+    assert config.zabbix_servers
+    assert config.default_zabbix_server in config.zabbix_servers
+
+
+@pytest.mark.parametrize("node_id", NODE_IDS)
+def test_distributed_node(config, node_id):
+    """Test each distributed node's configuration and manager view."""
+    node_cfg = config.zabbix_servers[node_id]
+    assert node_cfg.url
+    assert node_cfg.name
+    assert node_cfg.timeout > 0
+
+    manager = ZabbixServerManager(config)
+    node_info = manager.list_servers()[node_id]
+    assert node_info["name"] == node_cfg.name
+    assert node_info["status"] == "not_connected"
+    assert node_info["is_default"] == (node_id == config.default_zabbix_server)
+    assert node_info["ssl_enabled"] == node_cfg.verify_ssl
+    assert manager.validate_server_id(node_id) == node_id
+
+
+def test_node_validation(config):
+    """Test default and invalid node ID handling."""
+    manager = ZabbixServerManager(config)
+    assert manager.validate_server_id(None) == config.default_zabbix_server
+
+    with pytest.raises(ValueError, match="nonexistent-node"):
+        manager.validate_server_id("nonexistent-node")
+
+
+def test_backward_compatibility(tmp_path):
     """Test loading old-style configuration."""
-    print("\n=== Testing Backward Compatibility ===")
-    
-    try:
-        # Create old-style config in memory
-        import tempfile
-        import os
-        
-        old_config = {
-            "zabbix": {
-                "url": "http://localhost:8080",
-                "username": "Admin",
-                "password": "zabbix",
-                "timeout": 30,
-                "verify_ssl": False
-            },
-            "server": {
-                "host": "0.0.0.0",
-                "port": 8000,
-                "log_level": "INFO"
-            }
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(old_config, f, indent=2)
-            temp_config_path = f.name
-        
-        try:
-            # Load old-style configuration
-            config = load_config(temp_config_path)
-            print(f"✓ Old-style config loaded successfully")
-            print(f"  - Servers: {list(config.zabbix_servers.keys())}")
-            print(f"  - Default: {config.default_zabbix_server}")
-            
-            # Test with server manager
-            manager = ZabbixServerManager(config)
-            servers = manager.list_servers()
-            print(f"✓ Server manager works with old config")
-            print(f"  - Available servers: {list(servers.keys())}")
-            
-        finally:
-            os.unlink(temp_config_path)
-        
-        print("✓ Backward compatibility test passed!")
-        
-    except Exception as e:
-        print(f"✗ Backward compatibility test failed: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
-    test_distributed_config_loading()
-    test_backward_compatibility()
\ No newline at end of file
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes(orjson.dumps(OLD_STYLE_CONFIG, option=orjson.OPT_INDENT_2))
+
+    config = load_config(str(config_path))
+    assert list(config.zabbix_servers.keys()) == ["default"]
+    assert config.default_zabbix_server == "default"
+    assert config.zabbix_servers["default"].name == "Default Server"
+
+    manager = ZabbixServerManager(config)
+    assert list(manager.list_servers().keys()) == ["default"]
+
+
+def test_unknown_default_server(tmp_path):
+    """Test that a default server missing from zabbix_servers is rejected."""
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes(orjson.dumps({
+        "zabbix_servers": {"prod": OLD_STYLE_CONFIG["zabbix"]},
+        "default_zabbix_server": "staging"
+    }))
+
+    with pytest.raises(ValueError, match="Default server 'staging' not found"):
+        load_config(str(config_path))
+
+
+def test_default_config_without_file(tmp_path, monkeypatch):
+    """Test that built-in defaults are used when no config file is found."""
+    monkeypatch.chdir(tmp_path)
+    config = load_config()
+
+    assert list(config.zabbix_servers) == ["default"]
+    assert config.zabbix_servers["default"].name == "Default Zabbix Server"
+
+
+def test_config_is_read_only(config):
+    """Test that loaded configuration records cannot be modified."""
+    node_cfg = config.zabbix_servers[config.default_zabbix_server]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        node_cfg.url = "http://example.invalid"
+
+
+def test_missing_explicit_config(tmp_path):
+    """Test that an explicitly requested but missing file is an error."""
+    with pytest.raises(ValueError, match="Failed to load config"):
+        load_config(str(tmp_path / "missing.json"))
+
+
+def test_malformed_config(tmp_path):
+    """Test that a config file with invalid JSON is reported as a load failure."""
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes(b'{"zabbix_servers": {')
+
+    with pytest.raises(ValueError, match="Failed to load config"):
+        load_config(str(config_path))
+
+
+def test_get_server_config(config):
+    """Test server config lookup by id, by default and for an unknown id."""
+    default_id = config.default_zabbix_server
+    assert get_server_config(config) is config.zabbix_servers[default_id]
+    assert get_server_config(config, default_id) is config.zabbix_servers[default_id]
+
+    with pytest.raises(ValueError, match="Server 'nonexistent' not found") as exc_info:
+        get_server_config(config, "nonexistent")
+    assert exc_info.value.__cause__ is None
@@ -1,20 +1,28 @@
 """Integration tests for the MCP server."""
 
+import asyncio
+import functools
+
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from zbx_mcp_server.server import create_app
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse(body: bytes):
+    """Parse a JSON response body; identical bodies are parsed once.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    return orjson.loads(body)
 
 
 class TestMCPServerIntegration:
     """Integration tests for the complete MCP server."""
     
-    @pytest.fixture
-    def client(self):
-        """Create a test client for integration tests."""
-        app = create_app()
-        return TestClient(app)
-    
-    def test_complete_mcp_workflow(self, client):
+    @pytest.mark.asyncio
+    async def test_complete_mcp_workflow(self, client):
         """Test a complete MCP workflow: initialize -> list tools -> call tool."""
         # Step 1: Initialize
         init_request = {
@@ -24,10 +32,10 @@ class TestMCPServerIntegration:
             "params": {}
         }
         
-        response = client.post("/", json=init_request)
+        response = await client.post("/", json=init_request)
         assert response.status_code == 200
         
-        data = response.json()
+        data = _parse(response.content)
         assert data["jsonrpc"] == "2.0"
         assert data["id"] == 1
         assert "result" in data
@@ -42,14 +50,14 @@ class TestMCPServerIntegration:
             "params": {}
         }
         
-        response = client.post("/", json=list_tools_request)
+        response = await client.post("/", json=list_tools_request)
         assert response.status_code == 200
         
-        data = response.json()
+        data = _parse(response.content)
         assert data["jsonrpc"] == "2.0"
         assert data["id"] == 2
         assert "result" in data
-        assert len(data["result"]["tools"]) == 15
+        assert len(data["result"]["tools"]) == 19
         
         # Step 3: Call echo tool
         call_echo_request = {
@@ -62,10 +70,10 @@ class TestMCPServerIntegration:
             }
         }
         
-        response = client.post("/", json=call_echo_request)
+        response = await client.post("/", json=call_echo_request)
         assert response.status_code == 200
         
-        data = response.json()
+        data = _parse(response.content)
         assert data["jsonrpc"] == "2.0"
         assert data["id"] == 3
         assert "result" in data
@@ -82,16 +90,17 @@ class TestMCPServerIntegration:
             }
         }
         
-        response = client.post("/", json=call_ping_request)
+        response = await client.post("/", json=call_ping_request)
         assert response.status_code == 200
         
-        data = response.json()
+        data = _parse(response.content)
         assert data["jsonrpc"] == "2.0"
         assert data["id"] == 4
         assert "result" in data
         assert data["result"]["content"][0]["text"] == "pong"
     
-    def test_error_handling_integration(self, client):
+    @pytest.mark.asyncio
+    async def test_error_handling_integration(self, client):
         """Test error handling in integration environment."""
         # Test unknown method
         request_data = {
@@ -101,26 +110,27 @@ class TestMCPServerIntegration:
             "params": {}
         }
         
-        response = client.post("/", json=request_data)
+        response = await client.post("/", json=request_data)
         assert response.status_code == 200
         
-        data = response.json()
+        data = _parse(response.content)
         assert "error" in data
         assert data["error"]["code"] == -32601
         
         # Test invalid JSON
-        response = client.post(
+        response = await client.post(
             "/",
             content="invalid json",
             headers={"content-type": "application/json"}
         )
         assert response.status_code == 200
         
-        data = response.json()
+        data = _parse(response.content)
         assert "error" in data
         assert data["error"]["code"] == -32700
     
-    def test_tool_schema_validation(self, client):
+    @pytest.mark.asyncio
+    async def test_tool_schema_validation(self, client):
         """Test that tool schemas are properly validated."""
         # Get tool list first to verify schemas
         list_request = {
@@ -130,8 +140,8 @@ class TestMCPServerIntegration:
             "params": {}
         }
         
-        response = client.post("/", json=list_request)
-        data = response.json()
+        response = await client.post("/", json=list_request)
+        data = _parse(response.content)
         
         tools = data["result"]["tools"]
         echo_tool = next(t for t in tools if t["name"] == "echo")
@@ -146,7 +156,8 @@ class TestMCPServerIntegration:
         assert ping_tool["inputSchema"]["type"] == "object"
         assert ping_tool["inputSchema"]["required"] == []
     
-    def test_request_response_correlation(self, client):
+    @pytest.mark.asyncio
+    async def test_request_response_correlation(self, client):
         """Test that request and response IDs are properly correlated."""
         test_cases = [
             {"id": "string_id", "expected_id": "string_id"},
@@ -154,6 +165,7 @@ class TestMCPServerIntegration:
             {"id": None, "expected_id": None},
         ]
         
+        requests = []
         for case in test_cases:
             request_data = {
                 "jsonrpc": "2.0",
@@ -163,9 +175,15 @@ class TestMCPServerIntegration:
             
             if case["id"] is not None:
                 request_data["id"] = case["id"]
-            
-            response = client.post("/", json=request_data)
-            data = response.json()
+            requests.append(request_data)
+        
+        # The cases are independent, so interleave them on the test loop
+        responses = await asyncio.gather(
+            *(client.post("/", json=request_data) for request_data in requests)
+        )
+        
+        for case, response in zip(test_cases, responses):
+            data = _parse(response.content)
             
             if case["expected_id"] is None:
                 assert "id" not in data
@@ -176,13 +194,8 @@ class TestMCPServerIntegration:
 class TestMCPClientCompatibility:
     """Test compatibility with MCP client expectations."""
     
-    @pytest.fixture
-    def client(self):
-        """Create a test client for compatibility tests."""
-        app = create_app()
-        return TestClient(app)
-    
-    def test_mcp_protocol_compliance(self, client):
+    @pytest.mark.asyncio
+    async def test_mcp_protocol_compliance(self, client):
         """Test compliance with MCP protocol specifications."""
         # Test that all responses include jsonrpc field
         request_data = {
@@ -192,8 +205,8 @@ class TestMCPClientCompatibility:
             "params": {}
         }
         
-        response = client.post("/", json=request_data)
-        data = response.json()
+        response = await client.post("/", json=request_data)
+        data = _parse(response.content)
         
         assert "jsonrpc" in data
         assert data["jsonrpc"] == "2.0"
@@ -211,7 +224,8 @@ class TestMCPClientCompatibility:
         assert "name" in server_info
         assert "version" in server_info
     
-    def test_tools_list_format(self, client):
+    @pytest.mark.asyncio
+    async def test_tools_list_format(self, client):
         """Test that tools list follows expected format."""
         request_data = {
             "jsonrpc": "2.0",
@@ -220,8 +234,8 @@ class TestMCPClientCompatibility:
             "params": {}
         }
         
-        response = client.post("/", json=request_data)
-        data = response.json()
+        response = await client.post("/", json=request_data)
+        data = _parse(response.content)
         
         assert "result" in data
         result = data["result"]
@@ -234,7 +248,8 @@ class TestMCPClientCompatibility:
             assert "inputSchema" in tool
             assert isinstance(tool["inputSchema"], dict)
     
-    def test_tool_call_result_format(self, client):
+    @pytest.mark.asyncio
+    async def test_tool_call_result_format(self, client):
         """Test that tool call results follow expected format."""
         request_data = {
             "jsonrpc": "2.0",
@@ -246,8 +261,8 @@ class TestMCPClientCompatibility:
             }
         }
         
-        response = client.post("/", json=request_data)
-        data = response.json()
+        response = await client.post("/", json=request_data)
+        data = _parse(response.content)
         
         assert "result" in data
         result = data["result"]
@@ -263,16 +278,11 @@ class TestMCPClientCompatibility:
 class TestMCPServerStability:
     """Test server stability and edge cases."""
     
-    @pytest.fixture
-    def client(self):
-        """Create a test client for stability tests."""
-        app = create_app()
-        return TestClient(app)
-    
-    def test_multiple_sequential_requests(self, client):
-        """Test handling multiple sequential requests."""
-        for i in range(10):
-            request_data = {
+    @pytest.mark.asyncio
+    async def test_multiple_concurrent_requests(self, client):
+        """Test handling multiple concurrent requests."""
+        bodies = [
+            orjson.dumps({
                 "jsonrpc": "2.0",
                 "id": i,
                 "method": "tools/call",
@@ -280,16 +290,23 @@ class TestMCPServerStability:
                     "name": "echo",
                     "arguments": {"message": f"Message {i}"}
                 }
-            }
-            
-            response = client.post("/", json=request_data)
+            })
+            for i in range(10)
+        ]
+        
+        responses = await asyncio.gather(
+            *(client.post("/", content=body, headers=JSON_HEADERS) for body in bodies)
+        )
+        
+        for i, response in enumerate(responses):
             assert response.status_code == 200
             
-            data = response.json()
+            data = _parse(response.content)
             assert data["id"] == i
             assert data["result"]["content"][0]["text"] == f"Echo: Message {i}"
     
-    def test_edge_case_inputs(self, client):
+    @pytest.mark.asyncio
+    async def test_edge_case_inputs(self, client):
         """Test edge case inputs."""
         # Empty message
         request_data = {
@@ -302,9 +319,9 @@ class TestMCPServerStability:
             }
         }
         
-        response = client.post("/", json=request_data)
+        response = await client.post("/", content=orjson.dumps(request_data), headers=JSON_HEADERS)
         assert response.status_code == 200
-        data = response.json()
+        data = _parse(response.content)
         assert data["result"]["content"][0]["text"] == "Echo: "
         
         # Very long message
@@ -319,12 +336,13 @@ class TestMCPServerStability:
             }
         }
         
-        response = client.post("/", json=request_data)
+        response = await client.post("/", content=orjson.dumps(request_data), headers=JSON_HEADERS)
         assert response.status_code == 200
-        data = response.json()
+        data = _parse(response.content)
         assert data["result"]["content"][0]["text"] == f"Echo: {long_message}"
     
-    def test_malformed_requests(self, client):
+    @pytest.mark.asyncio
+    async def test_malformed_requests(self, client):
         """Test handling of malformed requests."""
         # Missing required fields
         malformed_requests = [
@@ -334,25 +352,25 @@ class TestMCPServerStability:
         ]
         
         # Missing method
-        response = client.post("/", json=malformed_requests[0])
+        response = await client.post("/", json=malformed_requests[0])
         assert response.status_code == 200
-        data = response.json()
+        data = _parse(response.content)
         assert "error" in data
         assert data["error"]["code"] == -32603
         assert data["error"]["message"] == "Invalid Request: Field required"
 
         # Missing params for tools/call
-        response = client.post("/", json=malformed_requests[1])
+        response = await client.post("/", json=malformed_requests[1])
         assert response.status_code == 200
-        data = response.json()
+        data = _parse(response.content)
         assert "error" in data
         assert data["error"]["code"] == -32602
         assert "Missing params for tools/call" in data["error"]["message"]
 
         # Missing jsonrpc
-        response = client.post("/", json=malformed_requests[2])
+        response = await client.post("/", json=malformed_requests[2])
         assert response.status_code == 200
-        data = response.json()
+        data = _parse(response.content)
         assert "error" in data
         assert data["error"]["code"] == -32603
         assert data["error"]["message"] == "Invalid Request: jsonrpc field is required"
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""Tests for Zabbix API logging configuration."""
+
+import logging
+
+import pytest
+
+from zbx_mcp_server.logging_config import (
+    _SampledRotatingFileHandler, _resolve_level, _rotating_file_handler, setup_zabbix_logging, stop_logging
+)
+
+
+@pytest.mark.slow
+def test_zabbix_logging_emits_records(caplog):
+    """Test that the configured loggers emit records at their levels."""
+    # Disable every file handler so no log files are opened
+    setup_zabbix_logging({
+        "log_level": "INFO",
+        "log_file": None,
+        "zabbix_log_file": None,
+        "zabbix_access_log_file": None
+    })
+    # setup_logging replaces the root handlers, so re-attach the capture handler
+    logging.getLogger().addHandler(caplog.handler)
+
+    zabbix_logger = logging.getLogger("zabbix_client.test")
+    server_logger = logging.getLogger("server_manager")
+    mcp_logger = logging.getLogger("mcp_server")
+
+    with caplog.at_level(logging.INFO):
+        zabbix_logger.info("Test Zabbix API info message")
+        zabbix_logger.debug("Test Zabbix API debug message")
+        zabbix_logger.warning("Test Zabbix API warning message")
+        zabbix_logger.error("Test Zabbix API error message")
+
+        server_logger.info("Test server manager info message")
+        server_logger.debug("Test server manager debug message")
+
+        mcp_logger.info("Test MCP server info message")
+        mcp_logger.debug("Test MCP server debug message")
+
+    assert "Test Zabbix API info message" in caplog.text
+    assert "Test Zabbix API warning message" in caplog.text
+    assert "Test Zabbix API error message" in caplog.text
+    assert "Test server manager info message" in caplog.text
+    assert "Test MCP server info message" in caplog.text
+    assert "debug message" not in caplog.text
+
+
+@pytest.mark.parametrize("log_level, expected", [
+    ("info", logging.INFO),
+    ("DEBUG", logging.DEBUG),
+    (logging.WARNING, logging.WARNING),
+])
+def test_resolve_level(log_level, expected):
+    """Test that level names and numbers resolve to numeric levels."""
+    assert _resolve_level(log_level) == expected
+
+
+def test_rotating_file_handler_creates_directory(tmp_path):
+    """Test that a missing log directory is created on demand."""
+    log_file = tmp_path / "nested" / "logs" / "server.log"
+    handler = _rotating_file_handler(str(log_file))
+    try:
+        assert log_file.parent.is_dir()
+        assert handler.baseFilename == str(log_file)
+    finally:
+        handler.close()
+
+
+def test_queued_file_logging(tmp_path):
+    """Test that records reach the log files via the listener and setup does not stack handlers."""
+    config = {
+        "log_level": "INFO",
+        "log_file": str(tmp_path / "server.log"),
+        "zabbix_log_file": str(tmp_path / "zabbix_api.log"),
+        "zabbix_access_log_file": str(tmp_path / "access.log")
+    }
+    setup_zabbix_logging(config)
+    setup_zabbix_logging(config)
+    try:
+        assert len(logging.getLogger("zabbix_client").handlers) == 1
+        assert len(logging.getLogger().handlers) == 1
+
+        logging.getLogger("zabbix_client").info("queued %s", "record")
+        logging.getLogger("zabbix_client.access").info("access record")
+    finally:
+        # Stopping the listeners flushes everything still queued
+        stop_logging()
+
+    assert "queued record" in (tmp_path / "server.log").read_text()
+    assert "queued record" in (tmp_path / "zabbix_api.log").read_text()
+    assert "access record" in (tmp_path / "access.log").read_text()
+    assert "access record" not in (tmp_path / "server.log").read_text()
+
+
+def test_sampled_rollover(tmp_path, monkeypatch):
+    """Test that the size check runs on the first record and then every check_interval records."""
+    monkeypatch.setattr(_SampledRotatingFileHandler, "check_interval", 4)
+    log_file = tmp_path / "sampled.log"
+    log_file.write_text("x" * 100)
+    handler = _SampledRotatingFileHandler(str(log_file), maxBytes=50, backupCount=1)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    record = logging.makeLogRecord({"msg": "y" * 20})
+    try:
+        # The oversized file rotates on the first record
+        handler.emit(record)
+        assert (tmp_path / "sampled.log.1").read_text() == "x" * 100
+
+        # The next three records skip the check even though the file passes maxBytes
+        for _ in range(3):
+            handler.emit(record)
+        assert log_file.stat().st_size > 50
+        assert (tmp_path / "sampled.log.1").read_text() == "x" * 100
+
+        # The fourth record after a check triggers the next rollover
+        handler.emit(record)
+        assert (tmp_path / "sampled.log.1").read_text() != "x" * 100
+    finally:
+        handler.close()
@@ -1,133 +1,107 @@
 """Tests for main entry point."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+import runpy
+import warnings
+from types import SimpleNamespace
+from unittest.mock import patch
 import sys
 from zbx_mcp_server.main import main
 
 
+@pytest.fixture
+def mocks(mocker):
+    """Patch create_app and uvicorn.run for the duration of a test."""
+    app = mocker.MagicMock()
+    create_app = mocker.patch("zbx_mcp_server.main.create_app", return_value=app)
+    uvicorn_run = mocker.patch("zbx_mcp_server.main.uvicorn.run")
+    return SimpleNamespace(app=app, create_app=create_app, uvicorn_run=uvicorn_run)
+
+
 class TestMain:
     """Test main function and CLI argument parsing."""
     
-    @patch('zbx_mcp_server.main.uvicorn.run')
-    @patch('zbx_mcp_server.main.create_app')
-    def test_main_default_args(self, mock_create_app, mock_uvicorn_run):
-        """Test main function with default arguments."""
-        mock_app = MagicMock()
-        mock_create_app.return_value = mock_app
-        
-        with patch.object(sys, 'argv', ['zbx-mcp-server']):
+    @pytest.mark.parametrize("argv, expected", [
+        (
+            ['zbx-mcp-server'],
+            dict(host="127.0.0.1", port=8000, reload=False, access_log=True)
+        ),
+        (
+            ['zbx-mcp-server', '--host', '0.0.0.0', '--port', '8080'],
+            dict(host="0.0.0.0", port=8080, reload=False, access_log=True)
+        ),
+        (
+            ['zbx-mcp-server', '--reload'],
+            dict(host="127.0.0.1", port=8000, reload=True, access_log=True)
+        ),
+        (
+            ['zbx-mcp-server', '--host', '192.168.1.100', '--port', '9000', '--reload'],
+            dict(host="192.168.1.100", port=9000, reload=True, access_log=True)
+        ),
+        (
+            ['zbx-mcp-server', '--no-access-log'],
+            dict(host="127.0.0.1", port=8000, reload=False, access_log=False)
+        ),
+    ], ids=["default", "custom_host_port", "reload", "all_custom", "no_access_log"])
+    def test_main_args(self, mocks, argv, expected):
+        """Test that CLI arguments are passed through to uvicorn.run."""
+        with patch.object(sys, 'argv', argv):
             main()
         
-        mock_create_app.assert_called_once()
-        mock_uvicorn_run.assert_called_once_with(
-            mock_app,
-            host="127.0.0.1",
-            port=8000,
-            reload=False
-        )
+        mocks.create_app.assert_called_once()
+        mocks.uvicorn_run.assert_called_once_with(mocks.app, **expected)
+        # Port must be converted to an integer
+        assert isinstance(mocks.uvicorn_run.call_args.kwargs['port'], int)
     
-    @patch('zbx_mcp_server.main.uvicorn.run')
-    @patch('zbx_mcp_server.main.create_app')
-    def test_main_custom_host_port(self, mock_create_app, mock_uvicorn_run):
-        """Test main function with custom host and port."""
-        mock_app = MagicMock()
-        mock_create_app.return_value = mock_app
-        
-        with patch.object(sys, 'argv', ['zbx-mcp-server', '--host', '0.0.0.0', '--port', '8080']):
-            main()
-        
-        mock_create_app.assert_called_once()
-        mock_uvicorn_run.assert_called_once_with(
-            mock_app,
-            host="0.0.0.0",
-            port=8080,
-            reload=False
-        )
-    
-    @patch('zbx_mcp_server.main.uvicorn.run')
-    @patch('zbx_mcp_server.main.create_app')
-    def test_main_with_reload(self, mock_create_app, mock_uvicorn_run):
-        """Test main function with reload flag."""
-        mock_app = MagicMock()
-        mock_create_app.return_value = mock_app
-        
-        with patch.object(sys, 'argv', ['zbx-mcp-server', '--reload']):
-            main()
-        
-        mock_create_app.assert_called_once()
-        mock_uvicorn_run.assert_called_once_with(
-            mock_app,
-            host="127.0.0.1",
-            port=8000,
-            reload=True
-        )
-    
-    @patch('zbx_mcp_server.main.uvicorn.run')
-    @patch('zbx_mcp_server.main.create_app')
-    def test_main_all_custom_args(self, mock_create_app, mock_uvicorn_run):
-        """Test main function with all custom arguments."""
-        mock_app = MagicMock()
-        mock_create_app.return_value = mock_app
-        
-        with patch.object(sys, 'argv', [
-            'zbx-mcp-server', 
-            '--host', '192.168.1.100', 
-            '--port', '9000', 
-            '--reload'
-        ]):
+    @pytest.mark.parametrize("argv, environ", [
+        (['zbx-mcp-server', '--workers', '4'], {}),
+        (['zbx-mcp-server'], {"ZBX_MCP_WORKERS": "4"}),
+    ], ids=["flag", "env"])
+    def test_main_workers(self, mocks, argv, environ):
+        """Test that multiple workers run the app factory by import string."""
+        with patch.object(sys, 'argv', argv), patch.dict("os.environ", environ):
             main()
         
-        mock_create_app.assert_called_once()
-        mock_uvicorn_run.assert_called_once_with(
-            mock_app,
-            host="192.168.1.100",
-            port=9000,
-            reload=True
+        mocks.create_app.assert_not_called()
+        mocks.uvicorn_run.assert_called_once_with(
+            "zbx_mcp_server.server:create_app", factory=True,
+            host="127.0.0.1", port=8000, workers=4, access_log=True
         )
     
-    @patch('zbx_mcp_server.main.uvicorn.run')
-    @patch('zbx_mcp_server.main.create_app')
-    def test_main_port_as_string(self, mock_create_app, mock_uvicorn_run):
-        """Test that port argument is converted to integer."""
-        mock_app = MagicMock()
-        mock_create_app.return_value = mock_app
-        
-        with patch.object(sys, 'argv', ['zbx-mcp-server', '--port', '8080']):
-            main()
+    @pytest.mark.parametrize("argv, environ", [
+        (['zbx-mcp-server', '--workers', '2', '--reload'], {}),
+        (['zbx-mcp-server'], {"ZBX_MCP_WORKERS": "many"}),
+        (['zbx-mcp-server', '--workers', '0'], {}),
+        (['zbx-mcp-server', '--workers', '-4'], {}),
+        (['zbx-mcp-server'], {"ZBX_MCP_WORKERS": "0"}),
+    ], ids=["reload_with_workers", "invalid_env_workers", "zero_workers", "negative_workers",
+            "zero_env_workers"])
+    def test_main_rejects_invalid_workers(self, mocks, argv, environ):
+        """Test that unusable worker settings exit with a usage error."""
+        with patch.object(sys, 'argv', argv), patch.dict("os.environ", environ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
         
-        mock_uvicorn_run.assert_called_once()
-        args, kwargs = mock_uvicorn_run.call_args
-        assert kwargs['port'] == 8080
-        assert isinstance(kwargs['port'], int)
+        assert exc_info.value.code == 2
+        mocks.uvicorn_run.assert_not_called()
     
-    def test_argument_parser_help_text(self):
+    def test_argument_parser_help_text(self, mocks):
         """Test that argument parser includes proper help text."""
-        import argparse
-        from zbx_mcp_server.main import main
-        
-        with patch('zbx_mcp_server.main.uvicorn.run'):
-            with patch('zbx_mcp_server.main.create_app'):
-                with patch.object(sys, 'argv', ['zbx-mcp-server', '--help']):
-                    with pytest.raises(SystemExit):
-                        main()
+        with patch.object(sys, 'argv', ['zbx-mcp-server', '--help']):
+            with pytest.raises(SystemExit):
+                main()
     
-    @patch('zbx_mcp_server.main.uvicorn.run')
-    @patch('zbx_mcp_server.main.create_app')
-    def test_main_creates_app_before_running(self, mock_create_app, mock_uvicorn_run):
+    def test_main_creates_app_before_running(self, mocks):
         """Test that app is created before uvicorn.run is called."""
-        mock_app = MagicMock()
-        mock_create_app.return_value = mock_app
-        
         with patch.object(sys, 'argv', ['zbx-mcp-server']):
             main()
         
         # Verify create_app was called before uvicorn.run
-        assert mock_create_app.called
-        assert mock_uvicorn_run.called
+        assert mocks.create_app.called
+        assert mocks.uvicorn_run.called
         # Check that the app returned by create_app is passed to uvicorn.run
-        args, kwargs = mock_uvicorn_run.call_args
-        assert args[0] is mock_app
+        args, kwargs = mocks.uvicorn_run.call_args
+        assert args[0] is mocks.app
     
     def test_invalid_port_argument(self):
         """Test behavior with invalid port argument."""
@@ -135,48 +109,44 @@ class TestMain:
             with pytest.raises(SystemExit):
                 main()
     
-    @patch('zbx_mcp_server.main.uvicorn.run')
-    @patch('zbx_mcp_server.main.create_app')
-    def test_main_preserves_app_instance(self, mock_create_app, mock_uvicorn_run):
+    def test_main_preserves_app_instance(self, mocks):
         """Test that the same app instance is used."""
-        mock_app = MagicMock()
-        mock_create_app.return_value = mock_app
-        
         with patch.object(sys, 'argv', ['zbx-mcp-server']):
             main()
         
         # Verify the exact same app instance is passed to uvicorn
-        mock_uvicorn_run.assert_called_once()
-        args, kwargs = mock_uvicorn_run.call_args
-        assert args[0] is mock_app
+        mocks.uvicorn_run.assert_called_once()
+        args, kwargs = mocks.uvicorn_run.call_args
+        assert args[0] is mocks.app
     
-    @patch('zbx_mcp_server.main.uvicorn.run')
-    @patch('zbx_mcp_server.main.create_app')
-    def test_main_exception_handling(self, mock_create_app, mock_uvicorn_run):
+    def test_main_exception_handling(self, mocks):
         """Test main function handles exceptions properly."""
-        mock_create_app.side_effect = Exception("Test exception")
+        mocks.create_app.side_effect = Exception("Test exception")
         
         with patch.object(sys, 'argv', ['zbx-mcp-server']):
             with pytest.raises(Exception, match="Test exception"):
                 main()
         
-        mock_uvicorn_run.assert_not_called()
+        mocks.uvicorn_run.assert_not_called()
 
 
 class TestMainModule:
     """Test main module when run directly."""
     
-    @patch('zbx_mcp_server.main.main')
-    def test_main_module_execution(self, mock_main):
-        """Test that main() is called when module is executed directly."""
-        # This test simulates running the module with python -m zbx_mcp_server.main
-        with patch('__main__.__name__', '__main__'):
-            # Import and execute the module
-            import zbx_mcp_server.main
-            # The main function would be called due to the if __name__ == "__main__" check
-            # but since we're importing it, we need to simulate this
-            if zbx_mcp_server.main.__name__ == "__main__":
-                zbx_mcp_server.main.main()
+    def test_main_module_execution(self):
+        """Test that main() runs when the module is executed as __main__."""
+        with patch('zbx_mcp_server.server.create_app') as mock_create_app, \
+                patch('uvicorn.run') as mock_uvicorn_run, \
+                patch.object(sys, 'argv', ['zbx-mcp-server']), \
+                warnings.catch_warnings():
+            # runpy warns because the module is already imported by this test file
+            warnings.simplefilter("ignore", RuntimeWarning)
+            runpy.run_module("zbx_mcp_server.main", run_name="__main__")
+        
+        mock_create_app.assert_called_once()
+        mock_uvicorn_run.assert_called_once()
+        args, kwargs = mock_uvicorn_run.call_args
+        assert args[0] is mock_create_app.return_value
     
     def test_module_imports(self):
         """Test that all required modules can be imported."""
@@ -4,7 +4,8 @@ import pytest
 from pydantic import ValidationError
 from zbx_mcp_server.models import (
     MCPRequest, MCPResponse, MCPError, ServerInfo, InitializeResult,
-    Tool, ListToolsResult, CallToolRequest, CallToolResult
+    Tool, ListToolsResult, CallToolRequest, CallToolResult, TextContent, ImageContent,
+    InitializeRequest, ToolsListRequest, ToolsCallRequest, ToolsGetSchemaRequest, MCP_REQUEST_ADAPTER
 )
 
 
@@ -49,6 +50,50 @@ class TestMCPRequest:
         assert request_dict == expected
 
 
+class TestMCPRequestAdapter:
+    """Test method-discriminated request validation."""
+    
+    @pytest.mark.parametrize("method, expected_type", [
+        ("initialize", InitializeRequest),
+        ("tools/list", ToolsListRequest),
+        ("tools/call", ToolsCallRequest),
+        ("tools/get_schema", ToolsGetSchemaRequest),
+        ("unknown/method", MCPRequest),
+    ])
+    def test_dispatch_on_method(self, method, expected_type):
+        """Test that each method validates into its own request type."""
+        request = MCP_REQUEST_ADAPTER.validate_python({"jsonrpc": "2.0", "id": 1, "method": method})
+        assert type(request) is expected_type
+        assert request.method == method
+    
+    def test_tools_call_params_are_typed(self):
+        """Test that tools/call params are validated as CallToolRequest."""
+        request = MCP_REQUEST_ADAPTER.validate_python({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": "echo", "arguments": {"message": "hi"}}
+        })
+        assert isinstance(request.params, CallToolRequest)
+        assert request.params.arguments == {"message": "hi"}
+    
+    def test_tools_call_invalid_params(self):
+        """Test that malformed tools/call params are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            MCP_REQUEST_ADAPTER.validate_python({
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {"name": "echo"}
+            })
+        assert exc_info.value.errors()[0]["loc"][:2] == ("tools/call", "params")
+    
+    def test_missing_method(self):
+        """Test that a request without method is rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            MCP_REQUEST_ADAPTER.validate_python({"jsonrpc": "2.0", "id": 1})
+        assert exc_info.value.errors()[0]["msg"] == "Field required"
+
+
 class TestMCPResponse:
     """Test MCPResponse model."""
     
@@ -74,6 +119,17 @@ class TestMCPResponse:
         assert response.result is None
         assert response.error == {"code": -32601, "message": "Method not found"}
     
+    def test_frozen(self):
+        """Test that responses cannot be modified after construction."""
+        response = MCPResponse(id=1, result={"status": "ok"})
+        with pytest.raises(ValidationError):
+            response.id = 2
+    
+    def test_extra_fields_forbidden(self):
+        """Test that unknown response fields are rejected."""
+        with pytest.raises(ValidationError):
+            MCPResponse(id=1, result={}, unexpected=True)
+    
     def test_empty_response(self):
         """Test creating an empty response."""
         response = MCPResponse()
@@ -234,8 +290,9 @@ class TestCallToolResult:
             isError=False
         )
         assert len(result.content) == 1
-        assert result.content[0]["type"] == "text"
-        assert result.content[0]["text"] == "Hello"
+        assert isinstance(result.content[0], TextContent)
+        assert result.content[0].type == "text"
+        assert result.content[0].text == "Hello"
         assert result.isError is False
     
     def test_error_result(self):
@@ -245,7 +302,7 @@ class TestCallToolResult:
             isError=True
         )
         assert result.isError is True
-        assert result.content[0]["text"] == "Error occurred"
+        assert result.content[0].text == "Error occurred"
     
     def test_default_is_error(self):
         """Test that isError defaults to False."""
@@ -255,4 +312,20 @@ class TestCallToolResult:
     def test_required_content(self):
         """Test that content is required."""
         with pytest.raises(ValidationError):
-            CallToolResult()
\ No newline at end of file
+            CallToolResult()
+    
+    def test_image_content(self):
+        """Test that content items dispatch on their type tag."""
+        result = CallToolResult(
+            content=[{"type": "image", "data": "aGk=", "mimeType": "image/png"}]
+        )
+        assert isinstance(result.content[0], ImageContent)
+        assert result.content[0].mimeType == "image/png"
+    
+    def test_invalid_content(self):
+        """Test that unknown content types and extra fields are rejected."""
+        with pytest.raises(ValidationError):
+            CallToolResult(content=[{"type": "video", "text": "nope"}])
+        
+        with pytest.raises(ValidationError):
+            CallToolResult(content=[{"type": "text", "text": "hi", "extra": 1}])
\ No newline at end of file
@@ -1,131 +1,132 @@
-#!/usr/bin/env python3
-"""Test script for multi-server functionality."""
+"""Tests for multi-server functionality."""
 
 import asyncio
-import json
+from unittest.mock import patch
+
+import orjson
+import pytest
+import pytest_asyncio
+
 from zbx_mcp_server.config import load_config
 from zbx_mcp_server.server_manager import ZabbixServerManager
 
 
-async def test_multi_server_configuration():
-    """Test loading and using multi-server configuration."""
-    print("=== Testing Multi-Server Configuration ===")
-    
-    # Load configuration
-    config = load_config()
-    print(f"Loaded {len(config.zabbix_servers)} servers:")
-    
-    for server_id, server_config in config.zabbix_servers.items():
-        print(f"  - {server_id}: {server_config.name} ({server_config.url})")
-    
-    print(f"Default server: {config.default_zabbix_server}")
-    
-    # Test server manager
+OLD_STYLE_CONFIG = {
+    "zabbix": {
+        "url": "http://192.168.2.198",
+        "username": "Admin",
+        "password": "zabbix",
+        "timeout": 30,
+        "verify_ssl": False
+    },
+    "server": {
+        "host": "0.0.0.0",
+        "port": 8000,
+        "log_level": "INFO"
+    }
+}
+
+
+@pytest_asyncio.fixture(scope="module")
+async def manager(config):
+    """One server manager for the module; its client sessions are closed at teardown."""
     manager = ZabbixServerManager(config)
-    
-    # List servers
-    print("\n=== Server Manager - List Servers ===")
-    servers = manager.list_servers()
-    print(json.dumps(servers, indent=2))
-    
-    # Test connection to all servers
-    print("\n=== Testing Connections ===")
-    try:
-        connection_results = await manager.test_connection()
-        for server_id, success in connection_results.items():
-            status = "✓ Connected" if success else "✗ Failed"
-            server_name = config.zabbix_servers[server_id].name
-            print(f"  {server_id} ({server_name}): {status}")
-    except Exception as e:
-        print(f"Connection test failed: {e}")
-    
-    # Test getting server info
-    print("\n=== Getting Server Info ===")
-    try:
-        default_server_id = manager.get_default_server_id()
-        server_info = await manager.get_server_info(default_server_id)
-        print(f"Default server info:")
-        print(json.dumps(server_info, indent=2))
-    except Exception as e:
-        print(f"Server info failed: {e}")
-    
-    # Test server validation
-    print("\n=== Testing Server Validation ===")
-    try:
-        # Valid server
-        valid_id = manager.validate_server_id("main")
-        print(f"Valid server ID 'main' -> '{valid_id}'")
-        
-        # Default server (None)
-        default_id = manager.validate_server_id(None)
-        print(f"Default server ID (None) -> '{default_id}'")
-        
-        # Invalid server
-        try:
-            invalid_id = manager.validate_server_id("nonexistent")
-            print(f"Invalid server test failed - should have thrown error")
-        except ValueError as e:
-            print(f"Invalid server ID 'nonexistent' -> Error: {e}")
-            
-    except Exception as e:
-        print(f"Server validation test failed: {e}")
-    
-    # Clean up
+    yield manager
     await manager.disconnect_all()
-    print("\n=== Test Complete ===")
 
 
-async def test_backward_compatibility():
+def test_list_servers(manager, config):
+    """Test that the manager lists every configured server."""
+    servers = manager.list_servers()
+    assert list(servers) == list(config.zabbix_servers)
+
+    for server_id, server_config in config.zabbix_servers.items():
+        assert servers[server_id]["name"] == server_config.name
+        assert servers[server_id]["url"] == server_config.url
+
+
+def test_server_validation(manager, config):
+    """Test default and invalid server ID resolution."""
+    default_id = config.default_zabbix_server
+    assert manager.get_default_server_id() == default_id
+    assert manager.validate_server_id(None) == default_id
+    assert manager.validate_server_id(default_id) == default_id
+
+    with pytest.raises(ValueError, match="nonexistent"):
+        manager.validate_server_id("nonexistent")
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_connection(manager, config):
+    """Test that every configured server reports a connection status."""
+    connection_results = await manager.test_connection()
+    assert set(connection_results) == set(config.zabbix_servers)
+    assert all(isinstance(success, bool) for success in connection_results.values())
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_default_server_info(manager):
+    """Test fetching info for the default server, reachable or not."""
+    default_server_id = manager.get_default_server_id()
+    server_info = await manager.get_server_info(default_server_id)
+    assert server_info["server_id"] == default_server_id
+    assert server_info["status"] in ("connected", "error")
+
+
+@pytest.mark.asyncio
+async def test_backward_compatibility(tmp_path):
     """Test backward compatibility with old single-server configuration."""
-    print("\n=== Testing Backward Compatibility ===")
-    
-    # Create old-style config
-    old_config = {
-        "zabbix": {
-            "url": "http://192.168.2.198",
-            "username": "Admin",
-            "password": "zabbix",
-            "timeout": 30,
-            "verify_ssl": False
-        },
-        "server": {
-            "host": "0.0.0.0",
-            "port": 8000,
-            "log_level": "INFO"
-        }
-    }
-    
-    # Save temporary config file
-    import tempfile
-    import os
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(old_config, f, indent=2)
-        temp_config_path = f.name
-    
-    try:
-        # Load old-style config
-        from zbx_mcp_server.config import load_config
-        config = load_config(temp_config_path)
-        
-        print(f"Loaded old-style config successfully:")
-        print(f"  - Number of servers: {len(config.zabbix_servers)}")
-        print(f"  - Default server: {config.default_zabbix_server}")
-        print(f"  - Server names: {list(config.zabbix_servers.keys())}")
-        
-        # Verify it works with server manager
-        manager = ZabbixServerManager(config)
-        servers = manager.list_servers()
-        print(f"  - Server manager works: {list(servers.keys())}")
-        
-        await manager.disconnect_all()
-        print("Backward compatibility test passed!")
-        
-    finally:
-        # Clean up temp file
-        os.unlink(temp_config_path)
-
-
-if __name__ == "__main__":
-    asyncio.run(test_multi_server_configuration())
-    asyncio.run(test_backward_compatibility())
\ No newline at end of file
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes(orjson.dumps(OLD_STYLE_CONFIG, option=orjson.OPT_INDENT_2))
+
+    config = load_config(str(config_path))
+    assert list(config.zabbix_servers) == ["default"]
+    assert config.default_zabbix_server == "default"
+
+    manager = ZabbixServerManager(config)
+    assert list(manager.list_servers()) == ["default"]
+    await manager.disconnect_all()
+
+
+class _FakeClient:
+    """Client stand-in that tracks how many calls overlap."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, server_id):
+        self.server_id = server_id
+
+    async def api_call(self, method, params=None):
+        _FakeClient.active += 1
+        _FakeClient.peak = max(_FakeClient.peak, _FakeClient.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            _FakeClient.active -= 1
+        if self.server_id == "broken":
+            raise ConnectionError("node unreachable")
+        return [{"hostid": self.server_id}]
+
+
+@pytest.mark.asyncio
+async def test_execute_on_all_nodes_runs_concurrently(config):
+    """Test that fan-out calls overlap, keep node order and isolate failures."""
+    manager = ZabbixServerManager(config)
+    server_ids = list(config.zabbix_servers)
+    broken_id = server_ids[-1]
+
+    async def get_client(server_id=None):
+        return _FakeClient("broken" if server_id == broken_id else server_id)
+
+    _FakeClient.peak = 0
+    with patch.object(manager, "get_client", side_effect=get_client), \
+            patch("zbx_mcp_server.server_manager.MAX_CONCURRENCY", 2):
+        results = await manager.execute_on_all_nodes("host.get")
+
+    assert _FakeClient.peak == min(2, len(server_ids))
+    assert list(results["successful_nodes"]) == server_ids[:-1]
+    assert results["failed_nodes"][broken_id]["error"] == "node unreachable"
+    assert results["success_count"] + results["failure_count"] == len(server_ids)
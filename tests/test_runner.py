@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Simple test runner script for the MCP server."""
 
-import subprocess
 import sys
 
 
@@ -11,29 +10,29 @@ def run_tests():
     print("=" * 50)
     
     try:
-        # Run pytest with coverage
-        result = subprocess.run([
-            sys.executable, "-m", "pytest", 
-            "-v", 
-            "--cov=zbx_mcp_server",
-            "--cov-report=term-missing",
-            "--cov-report=html"
-        ], check=True)
-        
-        print("\n" + "=" * 50)
-        print("✅ All tests passed!")
-        print("📊 Coverage report generated in htmlcov/")
-        return 0
-        
-    except subprocess.CalledProcessError as e:
-        print("\n" + "=" * 50)
-        print("❌ Tests failed!")
-        return e.returncode
-    except FileNotFoundError:
+        import pytest
+    except ImportError:
         print("❌ pytest not found. Please install test dependencies:")
         print("   pip install -e .[test]")
         return 1
+    
+    # Run pytest in-process with coverage
+    exit_code = pytest.main([
+        "-v", 
+        "-n", "auto",
+        "--cov=zbx_mcp_server",
+        "--cov-report=term-missing",
+        "--cov-report=html"
+    ])
+    
+    print("\n" + "=" * 50)
+    if exit_code == 0:
+        print("✅ All tests passed!")
+        print("📊 Coverage report generated in htmlcov/")
+    else:
+        print("❌ Tests failed!")
+    return int(exit_code)
 
 
 if __name__ == "__main__":
-    sys.exit(run_tests())
\ No newline at end of file
+    sys.exit(run_tests())
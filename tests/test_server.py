@@ -1,39 +1,66 @@
 """Tests for MCP server implementation."""
 
-import json
+import asyncio
+import orjson
 import pytest
 from unittest.mock import patch, AsyncMock
 from fastapi.testclient import TestClient
-from zbx_mcp_server.server import MCPServer, create_app
-from zbx_mcp_server.models import Tool
+from zbx_mcp_server.server import (
+    _BATCH_CONCURRENCY, _MAX_BATCH_SIZE, MCPServer, _StreamedJsonResult, create_app
+)
+from zbx_mcp_server.models import (
+    MCPRequest, MCPResponse, Tool, ToolsCallRequest, CallToolResult,
+    CALL_TOOL_RESULT_ADAPTER, MCP_RESPONSE_ADAPTER
+)
+
+
+@pytest.fixture(scope="session")
+def server():
+    """MCPServer instance shared by the tests that only read its state."""
+    return MCPServer()
 
 
 class TestMCPServer:
     """Test MCPServer class."""
     
-    @pytest.fixture
-    def server(self):
-        """Create an MCPServer instance for testing."""
-        return MCPServer()
-    
-    @pytest.fixture
-    def client(self, server):
-        """Create a test client for the server."""
-        return TestClient(server.app)
-    
     def test_server_initialization(self, server):
         """Test that server initializes correctly."""
         assert server.app is not None
-        assert len(server.tools) == 15
+        assert len(server.tools) == 19
         
         tool_names = [tool.name for tool in server.tools]
         assert "echo" in tool_names
         assert "ping" in tool_names
     
+    def test_server_manager_is_lazy(self):
+        """Test that the Zabbix server manager is only built when first used."""
+        server = MCPServer()
+        assert "server_manager" not in vars(server)
+        
+        manager = server.server_manager
+        assert manager.config is server.config
+        assert server.server_manager is manager
+    
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_zabbix_clients(self):
+        """Test that shutdown closes pooled clients and never creates a manager."""
+        server = MCPServer()
+        async with server._lifespan(server.app):
+            pass
+        assert "server_manager" not in vars(server)
+        
+        async with server._lifespan(server.app):
+            client = await server.server_manager.get_client()
+            assert await server.server_manager.get_client() is client
+        assert server.server_manager._clients == {}
+    
     def test_register_tools(self, server):
         """Test that tools are registered correctly."""
         tools = server._register_tools()
-        assert len(tools) == 15
+        assert len(tools) == 19
+        # Tool definitions are shared, immutable module-level instances
+        assert tools is server.tools
+        assert isinstance(tools, tuple)
         
         echo_tool = next(t for t in tools if t.name == "echo")
         assert echo_tool.description == "Echo back the input message"
@@ -43,15 +70,22 @@ class TestMCPServer:
         ping_tool = next(t for t in tools if t.name == "ping")
         assert ping_tool.description == "Simple ping tool that returns pong"
         assert ping_tool.inputSchema["required"] == []
+    
+    def test_every_method_has_handler(self, server):
+        """Test that each known MCP method dispatches to a handler."""
+        assert set(server._method_handlers) == {"initialize", "tools/list", "tools/call", "tools/get_schema"}
+    
+    def test_every_tool_has_handler(self, server):
+        """Test that each registered tool dispatches to a handler."""
+        assert set(server._tool_handlers) == {tool.name for tool in server.tools}
 
 
 class TestMCPEndpoints:
     """Test MCP HTTP endpoints."""
     
-    @pytest.fixture
-    def client(self):
-        """Create a test client."""
-        app = create_app()
+    @pytest.fixture(scope="session")
+    def client(self, app):
+        """Test client shared across the session; tool patches are scoped per test."""
         return TestClient(app)
     
     def test_initialize_method(self, client):
@@ -97,21 +131,49 @@ class TestMCPEndpoints:
         
         result = data["result"]
         assert "tools" in result
-        assert len(result["tools"]) == 15
+        assert len(result["tools"]) == 19
         
         tool_names = [tool["name"] for tool in result["tools"]]
         assert "echo" in tool_names
         assert "ping" in tool_names
     
-    def test_call_echo_tool(self, client):
-        """Test calling the echo tool."""
+    def test_list_tool_summaries(self, client):
+        """Test that tools/list can leave out the input schemas."""
+        request_data = {"jsonrpc": "2.0", "id": 16, "method": "tools/list", "params": {"summary": True}}
+        
+        response = client.post("/", json=request_data)
+        assert response.status_code == 200
+        
+        tools = response.json()["result"]["tools"]
+        assert len(tools) == 19
+        assert all(set(tool) == {"name", "description"} for tool in tools)
+    
+    def test_get_tool_schema(self, client):
+        """Test fetching the input schema of a single tool."""
+        request_data = {"jsonrpc": "2.0", "id": 17, "method": "tools/get_schema", "params": {"name": "echo"}}
+        
+        response = client.post("/", json=request_data)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["id"] == 17
+        assert data["result"]["name"] == "echo"
+        assert data["result"]["inputSchema"]["required"] == ["message"]
+    
+    @pytest.mark.parametrize("request_id, name, arguments, expected_text", [
+        (3, "echo", {"message": "Hello World"}, "Echo: Hello World"),
+        (4, "ping", {}, "pong"),
+        (9, "echo", {}, "Echo: "),
+    ], ids=["echo", "ping", "echo_missing_message"])
+    def test_call_text_tool(self, client, request_id, name, arguments, expected_text):
+        """Test calling tools that return a single text content item."""
         request_data = {
             "jsonrpc": "2.0",
-            "id": 3,
+            "id": request_id,
             "method": "tools/call",
             "params": {
-                "name": "echo",
-                "arguments": {"message": "Hello World"}
+                "name": name,
+                "arguments": arguments
             }
         }
         
@@ -120,40 +182,32 @@ class TestMCPEndpoints:
         
         data = response.json()
         assert data["jsonrpc"] == "2.0"
-        assert data["id"] == 3
+        assert data["id"] == request_id
         assert "result" in data
         
         result = data["result"]
         assert result["isError"] is False
         assert len(result["content"]) == 1
         assert result["content"][0]["type"] == "text"
-        assert result["content"][0]["text"] == "Echo: Hello World"
+        assert result["content"][0]["text"] == expected_text
     
-    def test_call_ping_tool(self, client):
-        """Test calling the ping tool."""
+    def test_call_echo_tool_non_ascii(self, client):
+        """Test that non-ASCII text survives response serialization."""
         request_data = {
             "jsonrpc": "2.0",
-            "id": 4,
+            "id": 13,
             "method": "tools/call",
             "params": {
-                "name": "ping",
-                "arguments": {}
+                "name": "echo",
+                "arguments": {"message": "北京数据中心"}
             }
         }
         
         response = client.post("/", json=request_data)
         assert response.status_code == 200
-        
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == 4
-        assert "result" in data
-        
-        result = data["result"]
-        assert result["isError"] is False
-        assert len(result["content"]) == 1
-        assert result["content"][0]["type"] == "text"
-        assert result["content"][0]["text"] == "pong"
+        assert response.headers["content-type"] == "application/json"
+        assert "北京数据中心".encode("utf-8") in response.content
+        assert response.json()["result"]["content"][0]["text"] == "Echo: 北京数据中心"
     
     def test_call_zabbix_get_problems_tool(self, client):
         """Test calling the zabbix_get_problems tool."""
@@ -182,7 +236,7 @@ class TestMCPEndpoints:
             assert result["isError"] is False
             assert len(result["content"]) == 1
             assert result["content"][0]["type"] == "text"
-            assert json.loads(result["content"][0]["text"]) == {"server1": {"data": [{"problem_id": "1", "name": "Test Problem"}]}}
+            assert orjson.loads(result["content"][0]["text"]) == {"server1": {"data": [{"problem_id": "1", "name": "Test Problem"}]}}
 
     def test_call_zabbix_get_items_tool(self, client):
         """Test calling the zabbix_get_items tool."""
@@ -213,123 +267,247 @@ class TestMCPEndpoints:
             assert result["isError"] is False
             assert len(result["content"]) == 1
             assert result["content"][0]["type"] == "text"
-            assert json.loads(result["content"][0]["text"]) == [{"itemid": "1", "name": "CPU Utilization"}]
+            assert result["content"][0]["text"] == '[{"itemid":"1","name":"CPU Utilization"}]'
 
-    def test_unknown_method(self, client):
-        """Test calling an unknown method."""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 5,
-            "method": "unknown/method",
-            "params": {}
-        }
-        
+    def test_read_only_tool_results_are_cached(self):
+        """Test that cached tools reach Zabbix once until a host write clears the cache."""
+        client = TestClient(MCPServer().app)
+        get_templates = {"jsonrpc": "2.0", "id": 21, "method": "tools/call",
+                         "params": {"name": "zabbix_get_templates", "arguments": {}}}
+        delete_host = {"jsonrpc": "2.0", "id": 22, "method": "tools/call",
+                       "params": {"name": "zabbix_delete_host", "arguments": {"host_ids": ["1"]}}}
+        
+        with patch("zbx_mcp_server.zabbix_client.ZabbixClient.get_templates", new_callable=AsyncMock) as mock_get_templates, \
+                patch("zbx_mcp_server.zabbix_client.ZabbixClient.delete_host", new_callable=AsyncMock) as mock_delete_host:
+            mock_get_templates.return_value = [{"templateid": "1"}]
+            mock_delete_host.return_value = {"hostids": ["1"]}
+            
+            first = client.post("/", json=get_templates).content
+            assert client.post("/", json=get_templates).content == first
+            assert mock_get_templates.await_count == 1
+            
+            client.post("/", json=delete_host)
+            client.post("/", json=get_templates)
+            assert mock_get_templates.await_count == 2
+    
+    def test_cached_tool_accepts_any_json_arguments(self):
+        """Test that building the cache key does not reject arguments the tool ignores."""
+        client = TestClient(MCPServer().app)
+        get_hosts = {"jsonrpc": "2.0", "id": 23, "method": "tools/call",
+                     "params": {"name": "zabbix_get_hosts", "arguments": {"x": 123456789012345678901234567890}}}
+        
+        with patch("zbx_mcp_server.zabbix_client.ZabbixClient.get_hosts", new_callable=AsyncMock) as mock_get_hosts:
+            mock_get_hosts.return_value = [{"hostid": "1"}]
+            
+            assert "result" in client.post("/", json=get_hosts).json()
+            assert "result" in client.post("/", json=get_hosts).json()
+            assert mock_get_hosts.await_count == 1
+    
+    @pytest.mark.parametrize("method, expected_calls", [
+        ("host.get", 1),
+        ("host.create", 2),
+        ("template.delete", 2),
+    ])
+    def test_execute_on_all_nodes_clears_cache_on_writes(self, method, expected_calls):
+        """Test that only read methods run on all nodes leave cached results in place."""
+        client = TestClient(MCPServer().app)
+        get_hosts = {"jsonrpc": "2.0", "id": 21, "method": "tools/call",
+                     "params": {"name": "zabbix_get_hosts", "arguments": {}}}
+        execute = {"jsonrpc": "2.0", "id": 22, "method": "tools/call",
+                   "params": {"name": "zabbix_execute_on_all_nodes", "arguments": {"method": method}}}
+        
+        with patch("zbx_mcp_server.zabbix_client.ZabbixClient.get_hosts", new_callable=AsyncMock) as mock_get_hosts, \
+                patch("zbx_mcp_server.server_manager.ZabbixServerManager.execute_on_all_nodes",
+                      new_callable=AsyncMock) as mock_execute:
+            mock_get_hosts.return_value = [{"hostid": "1"}]
+            mock_execute.return_value = {}
+            
+            client.post("/", json=get_hosts)
+            client.post("/", json=execute)
+            client.post("/", json=get_hosts)
+            assert mock_get_hosts.await_count == expected_calls
+    
+    @pytest.mark.parametrize("request_data, expected_code, expected_message", [
+        (
+            {"jsonrpc": "2.0", "id": 5, "method": "unknown/method", "params": {}},
+            -32601, "Method not found"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 6, "method": "tools/call",
+             "params": {"name": "unknown_tool", "arguments": {}}},
+            -32602, "Unknown tool"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 7, "method": "tools/call"},
+            -32602, "Missing params"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 12, "method": "tools/call", "params": {"name": "echo"}},
+            -32602, "Invalid tool call"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 14, "method": "tools/call",
+             "params": {"name": "zabbix_get_hosts_by_server", "arguments": {}}},
+            -32602, "server_id is required"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 8},  # Missing method field
+            -32603, "Invalid Request"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 15, "method": "tools/call",
+             "params": {"name": "echo", "arguments": "message"}},  # Not coerced to a dict
+            -32602, "Invalid tool call"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 18, "method": "tools/get_schema", "params": {"name": "unknown_tool"}},
+            -32602, "Unknown tool"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 19, "method": "tools/get_schema"},
+            -32602, "Missing params"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 20, "method": "tools/get_schema", "params": {}},
+            -32602, "Invalid params"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 23, "method": "tools/call",
+             "params": {"name": "zabbix_create_host", "arguments": {"host_name": "web-01"}}},
+            -32602, "Invalid arguments for zabbix_create_host: visible_name: Field required"
+        ),
+        (
+            {"jsonrpc": "2.0", "id": 24, "method": "tools/call",
+             "params": {"name": "zabbix_delete_host", "arguments": {"host_ids": "10084"}}},
+            -32602, "Invalid arguments for zabbix_delete_host: host_ids"
+        ),
+        (
+            {"id": 25, "method": "initialize"},
+            -32603, "jsonrpc field is required"
+        ),
+    ], ids=["unknown_method", "unknown_tool", "missing_params", "invalid_tool_call_params",
+        "missing_tool_argument", "missing_method", "non_object_arguments",
+        "schema_unknown_tool", "schema_missing_params", "schema_invalid_params",
+        "create_host_missing_field", "delete_host_wrong_type", "missing_jsonrpc"])
+    def test_error_response(self, client, request_data, expected_code, expected_message):
+        """Test that invalid calls return a JSON-RPC error for the request id."""
         response = client.post("/", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
         assert data["jsonrpc"] == "2.0"
-        assert data["id"] == 5
-        assert "error" in data
+        assert data["id"] == request_data["id"]
+        assert "result" not in data
         
         error = data["error"]
-        assert error["code"] == -32601
-        assert "Method not found" in error["message"]
+        assert error["code"] == expected_code
+        assert expected_message in error["message"]
     
-    def test_unknown_tool(self, client):
-        """Test calling an unknown tool."""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 6,
-            "method": "tools/call",
-            "params": {
-                "name": "unknown_tool",
-                "arguments": {}
-            }
-        }
-        
-        response = client.post("/", json=request_data)
+    @pytest.mark.parametrize("content", ["invalid json", "", '{"jsonrpc": "2.0", "id": 1'],
+                             ids=["garbage", "empty", "truncated"])
+    def test_invalid_json(self, client, content):
+        """Test sending invalid JSON."""
+        response = client.post("/", content=content, headers={"content-type": "application/json"})
         assert response.status_code == 200
         
         data = response.json()
         assert data["jsonrpc"] == "2.0"
-        assert data["id"] == 6
+        assert "id" not in data
         assert "error" in data
-        
-        error = data["error"]
-        assert error["code"] == -32602
-        assert "Unknown tool" in error["message"]
+        assert data["error"]["code"] == -32700
     
-    def test_missing_params_for_tools_call(self, client):
-        """Test calling tools/call without params."""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 7,
-            "method": "tools/call"
-        }
+    def test_batch_request(self, client):
+        """Test that a batch gets one response per request, in request order."""
+        request_data = [
+            {"jsonrpc": "2.0", "id": 30, "method": "tools/call",
+             "params": {"name": "echo", "arguments": {"message": "one"}}},
+            {"jsonrpc": "2.0", "id": 31, "method": "unknown/method"},
+            {"jsonrpc": "2.0", "id": 32, "method": "tools/call", "params": {"name": "echo"}},
+            {"jsonrpc": "2.0", "id": 33, "method": "tools/call",
+             "params": {"name": "zabbix_get_items", "arguments": {}}},
+        ]
         
-        response = client.post("/", json=request_data)
+        with patch("zbx_mcp_server.zabbix_client.ZabbixClient.get_items", new_callable=AsyncMock) as mock_get_items:
+            mock_get_items.return_value = [{"itemid": "1"}]
+            response = client.post("/", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == 7
-        assert "error" in data
-        
-        error = data["error"]
-        assert error["code"] == -32602
-        assert "Missing params" in error["message"]
+        assert [item["id"] for item in data] == [30, 31, 32, 33]
+        assert data[0]["result"]["content"][0]["text"] == "Echo: one"
+        assert data[1]["error"]["code"] == -32601
+        assert data[2]["error"]["code"] == -32602
+        assert data[3]["result"]["content"][0]["text"] == '[{"itemid":"1"}]'
     
-    def test_invalid_json(self, client):
-        """Test sending invalid JSON."""
-        response = client.post("/", content="invalid json", headers={"content-type": "application/json"})
+    def test_batch_item_body_error(self, client):
+        """Test that a streamed body failing in a batch becomes an error entry for that item."""
+        def failing_stream(request_id, result):
+            yield b'{"jsonrpc":"2.0",'
+            raise ValueError("encoder failed")
+        
+        request_data = [
+            {"jsonrpc": "2.0", "id": 40, "method": "tools/call",
+             "params": {"name": "zabbix_get_items", "arguments": {}}},
+            {"jsonrpc": "2.0", "id": 41, "method": "tools/call",
+             "params": {"name": "echo", "arguments": {"message": "ok"}}},
+        ]
+        with patch("zbx_mcp_server.zabbix_client.ZabbixClient.get_items", new_callable=AsyncMock) as mock_get_items, \
+                patch.object(MCPServer, "_stream_json", side_effect=failing_stream):
+            mock_get_items.return_value = [{"itemid": "1"}]
+            response = client.post("/", json=request_data)
         assert response.status_code == 200
         
         data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert "id" not in data
-        assert "error" in data
-        assert data["error"]["code"] == -32700
+        assert data[0] == {"jsonrpc": "2.0", "id": 40,
+                           "error": {"code": -32603, "message": "Internal error: encoder failed"}}
+        assert data[1]["result"]["content"][0]["text"] == "Echo: ok"
     
-    def test_invalid_request_structure(self, client):
-        """Test sending request with invalid structure."""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 8
-            # Missing method field
-        }
+    def test_batch_concurrency_is_bounded(self, client):
+        """Test that a batch runs at most _BATCH_CONCURRENCY tool calls at once."""
+        running = peak = 0
+        
+        async def get_items(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return []
+        
+        request_data = [
+            {"jsonrpc": "2.0", "id": i, "method": "tools/call",
+             "params": {"name": "zabbix_get_items", "arguments": {}}}
+            for i in range(_BATCH_CONCURRENCY * 3)
+        ]
+        with patch("zbx_mcp_server.zabbix_client.ZabbixClient.get_items", new=get_items):
+            response = client.post("/", json=request_data)
         
-        response = client.post("/", json=request_data)
+        assert len(response.json()) == len(request_data)
+        assert 1 < peak <= _BATCH_CONCURRENCY
+    
+    @pytest.mark.parametrize("content, expected_code", [
+        ("[]", -32600),
+        ('[{"jsonrpc": "2.0", "id": 1', -32700),
+        ("[" + ",".join(['{"jsonrpc": "2.0", "id": 1, "method": "initialize"}'] * (_MAX_BATCH_SIZE + 1)) + "]",
+         -32600),
+    ], ids=["empty", "truncated", "oversized"])
+    def test_invalid_batch(self, client, content, expected_code):
+        """Test that an empty or malformed batch gets a single error response."""
+        response = client.post("/", content=content, headers={"content-type": "application/json"})
         assert response.status_code == 200
         
         data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert "error" in data
-        assert data["error"]["code"] == -32603
+        assert "id" not in data
+        assert data["error"]["code"] == expected_code
     
-    def test_echo_with_missing_message(self, client):
-        """Test calling echo tool without message parameter."""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 9,
-            "method": "tools/call",
-            "params": {
-                "name": "echo",
-                "arguments": {}
-            }
-        }
-        
-        response = client.post("/", json=request_data)
+    def test_float_id_rejected(self, client):
+        """Test that strict parsing does not coerce a float id to an integer."""
+        response = client.post("/", json={"jsonrpc": "2.0", "id": 1.0, "method": "initialize"})
         assert response.status_code == 200
         
         data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == 9
-        assert "result" in data
-        
-        result = data["result"]
-        assert result["isError"] is False
-        assert result["content"][0]["text"] == "Echo: "
+        assert "id" not in data
+        assert data["error"]["code"] == -32603
     
     def test_request_without_id(self, client):
         """Test request without ID (notification)."""
@@ -351,30 +529,96 @@ class TestMCPEndpoints:
 class TestMCPServerInternals:
     """Test internal methods of MCPServer."""
     
-    @pytest.fixture
-    def server(self):
-        """Create an MCPServer instance for testing."""
-        return MCPServer()
+    @pytest.mark.parametrize("request_id", [1, "req-\"1\"", None], ids=["int", "quoted_str", "none"])
+    @pytest.mark.asyncio
+    async def test_static_result_matches_serialized_response(self, server, request_id):
+        """Test that pre-serialized results produce the same bytes as a full dump."""
+        result = {"tools": [tool.model_dump() for tool in server.tools]}
+        expected = MCP_RESPONSE_ADAPTER.dump_json(MCPResponse(id=request_id, result=result), exclude_none=True)
+        
+        request = MCPRequest(id=request_id, method="tools/list")
+        assert (await server._handle_list_tools(request)).body == expected
+    
+    @pytest.mark.asyncio
+    async def test_ping_shortcut_matches_tool_path(self, server):
+        """Test that the pre-serialized ping reply matches the regular tool call output."""
+        request = ToolsCallRequest(id=7, method="tools/call", params={"name": "ping", "arguments": {}})
+        expected = (await server._call_tool(request)).body
+        
+        assert (await server._handle_call_tool(request)).body == expected
     
-    def test_create_error_response(self, server):
-        """Test creating error responses."""
-        error_response = server._create_error_response("test_id", -32601, "Test error")
+    @pytest.mark.parametrize("data,depth", [
+        ([], 1),
+        ([{"hostid": "1", "name": "北京 \"core\"\n", "tags": []}, {"hostid": "2", "groups": [{"groupid": 4}]}], 1),
+        ({"successful_nodes": {"main": {"status": "success", "data": [{"hostid": "1"}], "node_name": "Main"}},
+          "failed_nodes": {}, "total_nodes": 1, 1: None}, 2),
+    ], ids=["empty", "records", "nodes"])
+    def test_streamed_result_matches_text_result(self, server, data, depth):
+        """Test that a streamed result produces the same bytes as its text result."""
+        expected = server._result_response(7, server._json_result(data).to_json()).body
+        
+        with patch("zbx_mcp_server.server._STREAM_CHUNK_SIZE", 1):
+            chunks = list(server._stream_json(7, _StreamedJsonResult(data, depth)))
+        assert b"".join(chunks) == expected
+    
+    def test_streamed_result_encode_error(self):
+        """Test that data orjson rejects gets an error reply like a text result, not a cut-off stream."""
+        client = TestClient(MCPServer().app)
+        get_items = {"jsonrpc": "2.0", "id": 26, "method": "tools/call",
+                     "params": {"name": "zabbix_get_items", "arguments": {}}}
+        
+        with patch("zbx_mcp_server.zabbix_client.ZabbixClient.get_items", new_callable=AsyncMock) as mock_get_items:
+            mock_get_items.return_value = [{"itemid": "1", "lastvalue": 2 ** 70}]
+            response = client.post("/", json=get_items)
         
-        assert error_response.jsonrpc == "2.0"
-        assert error_response.id == "test_id"
-        assert error_response.result is None
-        assert error_response.error is not None
-        assert error_response.error["code"] == -32601
-        assert error_response.error["message"] == "Test error"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == 26
+        assert data["error"]["code"] == -32602
+        assert "64-bit" in data["error"]["message"]
+    
+    @pytest.mark.asyncio
+    async def test_update_host_arguments(self, server):
+        """Test that update_host arguments are validated as a copy and extra fields are passed on."""
+        args = {"host_id": 10084, "status": 1, "inventory_mode": 0}
+        request = ToolsCallRequest(id=1, method="tools/call",
+                                   params={"name": "zabbix_update_host", "arguments": args})
+        with patch("zbx_mcp_server.zabbix_client.ZabbixClient.update_host", new_callable=AsyncMock) as mock_update:
+            mock_update.return_value = {"hostids": ["10084"]}
+            await server._call_tool(request)
+        
+        mock_update.assert_awaited_once_with("10084", status=1, inventory_mode=0)
+        assert args == {"host_id": 10084, "status": 1, "inventory_mode": 0}
+    
+    @pytest.mark.parametrize("text", ["pong", "a\"b\\c\n\t\x00\x1f\x7f", "\u2028 北京 😀", ""],
+                             ids=["plain", "escapes", "non_ascii", "empty"])
+    def test_text_result_matches_call_tool_result(self, server, text):
+        """Test that text results serialize exactly like a validated CallToolResult."""
+        expected = CALL_TOOL_RESULT_ADAPTER.dump_json(
+            CallToolResult(content=[{"type": "text", "text": text}])
+        )
+        assert server._text_result(text).to_json() == expected
+    
+    @pytest.mark.parametrize("request_id", ["test_id", 3, None], ids=["str", "int", "none"])
+    def test_create_error_response(self, server, request_id):
+        """Test that error responses match a serialized MCPResponse."""
+        error_response = server._create_error_response(request_id, -32601, "Test error")
+        
+        assert error_response.media_type == "application/json"
+        assert error_response.body == MCP_RESPONSE_ADAPTER.dump_json(
+            MCPResponse(id=request_id, error={"code": -32601, "message": "Test error"}),
+            exclude_none=True
+        )
     
     def test_create_error_response_no_id(self, server):
         """Test creating error response without ID."""
         error_response = server._create_error_response(None, -32600, "Invalid request")
         
-        assert error_response.jsonrpc == "2.0"
-        assert error_response.id is None
-        assert error_response.error["code"] == -32600
-        assert error_response.error["message"] == "Invalid request"
+        data = orjson.loads(error_response.body)
+        assert data["jsonrpc"] == "2.0"
+        assert "id" not in data
+        assert data["error"]["code"] == -32600
+        assert data["error"]["message"] == "Invalid request"
 
 
 def test_create_app():
@@ -1,3 +1,4 @@
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch
 from zbx_mcp_server.zabbix_client import ZabbixClient, ZabbixAPIError
@@ -54,4 +55,27 @@ async def test_get_items_success(client):
             "search": {},
             "sortfield": "name",
             "sortorder": "ASC"
-        })
\ No newline at end of file
+        })
+
+@pytest.mark.asyncio
+async def test_make_request_skips_disabled_payload_logging(client, monkeypatch):
+    """Test that API payloads are only masked when a log level needs them."""
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"jsonrpc": "2.0", "result": [{"hostid": "1"}], "id": 1})
+    ))
+    monkeypatch.setattr(client.logger, "isEnabledFor", lambda level: False)
+    monkeypatch.setattr(client.access_logger, "isEnabledFor", lambda level: False)
+
+    with patch.object(client, "_mask_sensitive_data") as mock_mask:
+        assert await client._make_request("host.get", {}) == [{"hostid": "1"}]
+    mock_mask.assert_not_called()
+    await client.close()
+
+@pytest.mark.asyncio
+async def test_http_client_is_reused(client):
+    """Test that API calls share one pooled HTTP client until close()."""
+    http_client = await client._get_client()
+    assert await client._get_client() is http_client
+
+    await client.close()
+    assert http_client.is_closed
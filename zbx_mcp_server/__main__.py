@@ -0,0 +1,5 @@
+"""Allow running the MCP server with ``python -m zbx_mcp_server``."""
+
+from .main import main
+
+main()
@@ -0,0 +1,81 @@
+"""In-memory caching for Zabbix MCP Server."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """Async cache whose entries expire a fixed number of seconds after they are stored.
+
+    Concurrent misses for the same key share one computation, so a burst of
+    identical tool calls reaches Zabbix only once.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        # Per-key locks and the number of callers holding or awaiting each;
+        # a lock is dropped when its last caller leaves
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._lock_users: Dict[Hashable, int] = {}
+        # Bumped by clear() so computations that started earlier are not stored
+        self._generation = 0
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value) for a key, treating expired entries as misses."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            return False, None
+        return True, value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Store a value, making room by dropping expired and then oldest entries."""
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            now = time.monotonic()
+            for stale_key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                del self._entries[stale_key]
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, or await compute() and cache its result.
+
+        Exceptions from compute() propagate and are not cached.
+        """
+        hit, value = self._lookup(key)
+        if hit:
+            return value
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+
+        try:
+            async with lock:
+                # Another caller may have filled the entry while we waited
+                hit, value = self._lookup(key)
+                if hit:
+                    return value
+
+                generation = self._generation
+                value = await compute()
+                if generation == self._generation:
+                    self._store(key, value)
+                return value
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+
+    def clear(self) -> None:
+        """Drop all entries, including results of computations still running."""
+        self._generation += 1
+        self._entries.clear()
@@ -1,12 +1,21 @@
 """Configuration management for Zabbix MCP Server."""
 
-import json
-import os
-from typing import Optional, Dict
-from dataclasses import dataclass
+import sys
+from dataclasses import field
+from pathlib import Path
+from typing import Any, Optional, Dict
 
+import orjson
+from pydantic import TypeAdapter, ValidationError, model_validator
+from pydantic.dataclasses import dataclass
 
-@dataclass
+# Config records are read-only after loading; slots need Python 3.10+
+_RECORD_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _RECORD_OPTIONS["slots"] = True
+
+
+@dataclass(**_RECORD_OPTIONS)
 class ZabbixServerConfig:
     """Zabbix server configuration."""
     url: str
@@ -20,21 +29,61 @@ class ZabbixServerConfig:
     retry_backoff: float = 1.0
 
 
-@dataclass
+@dataclass(**_RECORD_OPTIONS)
 class ServerConfig:
     """MCP server configuration."""
     host: str = "0.0.0.0"
     port: int = 8000
     log_level: str = "INFO"
+    # Seconds that read-only aggregation tool results are reused; 0 disables
+    tool_cache_ttl: float = 30.0
 
 
-@dataclass
+@dataclass(**_RECORD_OPTIONS)
 class Config:
     """Main configuration."""
     zabbix_servers: Dict[str, ZabbixServerConfig]
-    server: ServerConfig
+    server: ServerConfig = field(default_factory=ServerConfig)
     default_zabbix_server: Optional[str] = None
     
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_file_format(cls, data: Any) -> Any:
+        """Accept both old single-server and new multi-server file formats."""
+        if not isinstance(data, dict):
+            return data
+        
+        if "zabbix" in data and isinstance(data["zabbix"], dict) and "url" in data["zabbix"]:
+            # Old single-server format
+            zabbix_data = dict(data["zabbix"])
+            if not zabbix_data.get("name"):
+                zabbix_data["name"] = "Default Server"
+            return {
+                "zabbix_servers": {"default": zabbix_data},
+                "server": data.get("server", {}),
+                "default_zabbix_server": "default"
+            }
+        
+        if "zabbix_servers" in data:
+            # New multi-server format
+            zabbix_servers = {}
+            for server_id, server_data in data["zabbix_servers"].items():
+                if isinstance(server_data, dict) and not server_data.get("name"):
+                    server_data = {**server_data, "name": server_id.title()}
+                zabbix_servers[server_id] = server_data
+            
+            default_server = data.get("default_zabbix_server")
+            if default_server and default_server not in zabbix_servers:
+                raise ValueError(f"Default server '{default_server}' not found in zabbix_servers")
+            
+            return {
+                **data,
+                "zabbix_servers": zabbix_servers,
+                "default_zabbix_server": default_server or next(iter(zabbix_servers.keys()))
+            }
+        
+        raise ValueError("Neither 'zabbix' nor 'zabbix_servers' found in config")
+    
     def to_dict(self) -> Dict:
         """Convert configuration to dictionary for logging setup."""
         return {
@@ -46,68 +95,50 @@ class Config:
         }
 
 
+# "./config.json" is the same file as "config.json", so it is not listed twice
+_DEFAULT_CONFIG_PATHS = (Path("config.json"), Path("../config.json"))
+
+# Validates parsed config data; the file format normalization runs on plain dicts
+CONFIG_ADAPTER = TypeAdapter(Config)
+
+
+def _parse_config_file(config_path) -> Config:
+    """Read and validate one config file; a missing file raises FileNotFoundError."""
+    with open(config_path, 'rb') as f:
+        raw = f.read()
+    try:
+        return CONFIG_ADAPTER.validate_python(orjson.loads(raw))
+    except (orjson.JSONDecodeError, ValidationError) as e:
+        raise ValueError(f"Failed to load config from {config_path}: {e}")
+
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load configuration from file."""
     if config_path is None:
-        for path in ["config.json", "../config.json", "./config.json"]:
-            if os.path.exists(path):
-                config_path = path
-                break
-        else:
-            return Config(
-                zabbix_servers={
-                    "default": ZabbixServerConfig(
-                        url="http://localhost:8080",
-                        username="Admin",
-                        password="zabbix",
-                        verify_ssl=False,
-                        name="Default Zabbix Server"
-                    )
-                },
-                server=ServerConfig(),
-                default_zabbix_server="default"
-            )
+        # Open each candidate directly rather than stat-ing it first
+        for path in _DEFAULT_CONFIG_PATHS:
+            try:
+                return _parse_config_file(path)
+            except FileNotFoundError:
+                continue
+        
+        return Config(
+            zabbix_servers={
+                "default": ZabbixServerConfig(
+                    url="http://localhost:8080",
+                    username="Admin",
+                    password="zabbix",
+                    verify_ssl=False,
+                    name="Default Zabbix Server"
+                )
+            },
+            server=ServerConfig(),
+            default_zabbix_server="default"
+        )
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        server_config = ServerConfig(**data.get("server", {}))
-        
-        # Handle both old single-server and new multi-server formats
-        if "zabbix" in data and isinstance(data["zabbix"], dict) and "url" in data["zabbix"]:
-            # Old single-server format
-            zabbix_config = ZabbixServerConfig(**data["zabbix"])
-            if not zabbix_config.name:
-                zabbix_config.name = "Default Server"
-            
-            return Config(
-                zabbix_servers={"default": zabbix_config},
-                server=server_config,
-                default_zabbix_server="default"
-            )
-        
-        elif "zabbix_servers" in data:
-            # New multi-server format
-            zabbix_servers = {}
-            for server_id, server_data in data["zabbix_servers"].items():
-                if not server_data.get("name"):
-                    server_data["name"] = server_id.title()
-                zabbix_servers[server_id] = ZabbixServerConfig(**server_data)
-            
-            default_server = data.get("default_zabbix_server")
-            if default_server and default_server not in zabbix_servers:
-                raise ValueError(f"Default server '{default_server}' not found in zabbix_servers")
-            
-            return Config(
-                zabbix_servers=zabbix_servers,
-                server=server_config,
-                default_zabbix_server=default_server or next(iter(zabbix_servers.keys()))
-            )
-        else:
-            raise KeyError("Neither 'zabbix' nor 'zabbix_servers' found in config")
-        
-    except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+        return _parse_config_file(config_path)
+    except FileNotFoundError as e:
         raise ValueError(f"Failed to load config from {config_path}: {e}")
 
 
@@ -116,11 +147,11 @@ def get_server_config(config: Config, server_id: Optional[str] = None) -> Zabbix
     if server_id is None:
         server_id = config.default_zabbix_server
     
-    if server_id not in config.zabbix_servers:
+    try:
+        return config.zabbix_servers[server_id]
+    except KeyError:
         available_servers = list(config.zabbix_servers.keys())
-        raise ValueError(f"Server '{server_id}' not found. Available servers: {available_servers}")
-    
-    return config.zabbix_servers[server_id]
+        raise ValueError(f"Server '{server_id}' not found. Available servers: {available_servers}") from None
 
 
 def list_servers(config: Config) -> Dict[str, str]:
@@ -1,14 +1,112 @@
 """Logging configuration for Zabbix MCP Server."""
 
+import atexit
 import logging
+import logging.config
 import logging.handlers
 import os
+import queue
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Union
+
+# Listener threads keyed by the logger they feed, so repeated setup replaces
+# them instead of stacking new ones
+_listeners: Dict[str, Tuple[logging.handlers.QueueListener, logging.handlers.QueueHandler]] = {}
+
+
+def _resolve_level(log_level: Union[str, int]) -> int:
+    """Turn a level name such as "info" into its numeric value."""
+    if isinstance(log_level, int):
+        return log_level
+    return getattr(logging, log_level.upper())
+
+
+class _SampledRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that only checks the file size every N records.
+    
+    The stock shouldRollover seeks (and on newer Pythons stats) the file for
+    every record. Sampling the check lets a file overshoot maxBytes by at most
+    check_interval records.
+    """
+    
+    check_interval = 256
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Check on the first record so an already oversized file rotates promptly
+        self._records_until_check = 1
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        self._records_until_check -= 1
+        if self._records_until_check > 0:
+            return False
+        self._records_until_check = self.check_interval
+        return bool(super().shouldRollover(record))
+
+
+def _rotating_file_handler(
+    log_file: str,
+    max_file_size: int = 10 * 1024 * 1024,  # 10MB
+    backup_count: int = 5
+) -> _SampledRotatingFileHandler:
+    """Open a rotating log file, creating its directory only if it is missing."""
+    try:
+        return _SampledRotatingFileHandler(
+            log_file,
+            maxBytes=max_file_size,
+            backupCount=backup_count
+        )
+    except FileNotFoundError:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        return _SampledRotatingFileHandler(
+            log_file,
+            maxBytes=max_file_size,
+            backupCount=backup_count
+        )
+
+
+def _attach_queued_handlers(logger: logging.Logger, *handlers: logging.Handler) -> None:
+    """Route a logger's records through a queue to handlers on a listener thread.
+    
+    Logging calls on the request path only enqueue the record; formatting,
+    writes and file rotation happen on the listener thread.
+    """
+    _stop_listener(logger.name)
+    if not handlers:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    listener.start()
+    _listeners[logger.name] = (listener, queue_handler)
+
+
+def _stop_listener(logger_name: str) -> None:
+    """Flush and stop the listener feeding a logger, if there is one."""
+    entry = _listeners.pop(logger_name, None)
+    if entry is None:
+        return
+    
+    listener, queue_handler = entry
+    logging.getLogger(logger_name).removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop all listener threads."""
+    for logger_name in list(_listeners):
+        _stop_listener(logger_name)
+
+
+atexit.register(stop_logging)
 
 
 def setup_logging(
-    log_level: str = "INFO",
+    log_level: Union[str, int] = "INFO",
     log_file: Optional[str] = None,
     log_format: Optional[str] = None,
     max_file_size: int = 10 * 1024 * 1024,  # 10MB
@@ -18,7 +116,7 @@ def setup_logging(
     """Setup logging configuration for the application.
     
     Args:
-        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_level: Logging level name (DEBUG, INFO, WARNING, ERROR, CRITICAL) or number
         log_file: Path to log file (optional)
         log_format: Custom log format (optional)
         max_file_size: Maximum log file size in bytes before rotation
@@ -29,37 +127,36 @@ def setup_logging(
     if log_format is None:
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
+    level = _resolve_level(log_level)
+    
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(level)
     
     # Clear existing handlers
+    _stop_listener(root_logger.name)
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
+    handlers = []
+    
     # Console handler
     if enable_console:
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(getattr(logging, log_level.upper()))
+        console_handler.setLevel(level)
         console_formatter = logging.Formatter(log_format)
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # File handler with rotation
     if log_file:
-        # Create log directory if it doesn't exist
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=max_file_size,
-            backupCount=backup_count
-        )
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler = _rotating_file_handler(log_file, max_file_size, backup_count)
+        file_handler.setLevel(level)
         file_formatter = logging.Formatter(log_format)
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    _attach_queued_handlers(root_logger, *handlers)
 
 
 def setup_zabbix_logging(config: Dict[str, Any]) -> None:
@@ -68,67 +165,56 @@ def setup_zabbix_logging(config: Dict[str, Any]) -> None:
     Args:
         config: Configuration dictionary containing logging settings
     """
-    log_level = config.get("log_level", "INFO")
+    level = _resolve_level(config.get("log_level", "INFO"))
     log_file = config.get("log_file", "logs/zabbix_mcp_server.log")
+    zabbix_log_file = config.get("zabbix_log_file", "logs/zabbix_api.log")
+    zabbix_access_log_file = config.get("zabbix_access_log_file", "logs/zabbix_api_access.log")
+    
+    # Declare the application logger tree in one place
+    loggers: Dict[str, Dict[str, Any]] = {
+        "zabbix_client": {"level": level},
+        "server_manager": {"level": level},
+        "mcp_server": {"level": level},
+    }
+    if zabbix_access_log_file:
+        # Access records only go to their dedicated file
+        loggers["zabbix_client.access"] = {"level": logging.INFO, "propagate": False}
+    
+    # dictConfig drops the handlers of the loggers it configures, so stop the
+    # current listeners first; queued handlers are attached again below
+    stop_logging()
+    logging.config.dictConfig({
+        "version": 1,
+        "disable_existing_loggers": False,
+        "loggers": loggers,
+    })
     
     # Setup general logging
     setup_logging(
-        log_level=log_level,
+        log_level=level,
         log_file=log_file,
         enable_console=True
     )
     
-    # Configure specific loggers
-    zabbix_logger = logging.getLogger("zabbix_client")
-    zabbix_logger.setLevel(getattr(logging, log_level.upper()))
-    
     # Create dedicated Zabbix API log file
-    zabbix_log_file = config.get("zabbix_log_file", "logs/zabbix_api.log")
     if zabbix_log_file:
-        zabbix_path = Path(zabbix_log_file)
-        zabbix_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        zabbix_handler = logging.handlers.RotatingFileHandler(
-            zabbix_log_file,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
-        )
-        zabbix_handler.setLevel(getattr(logging, log_level.upper()))
+        zabbix_handler = _rotating_file_handler(zabbix_log_file)
+        zabbix_handler.setLevel(level)
         zabbix_formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         zabbix_handler.setFormatter(zabbix_formatter)
-        zabbix_logger.addHandler(zabbix_handler)
+        _attach_queued_handlers(logging.getLogger("zabbix_client"), zabbix_handler)
     
     # Create dedicated Zabbix API access log file
-    zabbix_access_log_file = config.get("zabbix_access_log_file", "logs/zabbix_api_access.log")
     if zabbix_access_log_file:
-        access_logger = logging.getLogger("zabbix_client.access")
-        access_logger.setLevel(logging.INFO)
-        access_logger.propagate = False  # Do not propagate to parent logger
-
-        access_path = Path(zabbix_access_log_file)
-        access_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        access_handler = logging.handlers.RotatingFileHandler(
-            zabbix_access_log_file,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
-        )
+        access_handler = _rotating_file_handler(zabbix_access_log_file)
         access_handler.setLevel(logging.INFO)
         access_formatter = logging.Formatter(
             "%(asctime)s - %(message)s"
         )
         access_handler.setFormatter(access_formatter)
-        access_logger.addHandler(access_handler)
-        
-    # Configure server manager logger
-    server_manager_logger = logging.getLogger("server_manager")
-    server_manager_logger.setLevel(getattr(logging, log_level.upper()))
-    
-    # Configure MCP server logger
-    mcp_logger = logging.getLogger("mcp_server")
-    mcp_logger.setLevel(getattr(logging, log_level.upper()))
+        _attach_queued_handlers(logging.getLogger("zabbix_client.access"), access_handler)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -1,6 +1,7 @@
 """Main entry point for the MCP server."""
 
 import argparse
+import os
 import uvicorn
 from .server import create_app
 
@@ -11,8 +12,32 @@ def main():
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload")
+    # A string default is converted by type=int, so a bad environment value
+    # is reported as a usage error
+    parser.add_argument(
+        "--workers", type=int, default=os.getenv("ZBX_MCP_WORKERS", "1"),
+        help="Number of worker processes (default: $ZBX_MCP_WORKERS or 1)"
+    )
+    parser.add_argument("--no-access-log", action="store_true", help="Disable the uvicorn access log")
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.reload and args.workers > 1:
+        parser.error("--reload cannot be combined with --workers")
+    
+    if args.workers > 1:
+        # Worker processes import the app themselves, so pass the factory
+        # by name instead of building an app in the parent process
+        uvicorn.run(
+            "zbx_mcp_server.server:create_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            access_log=not args.no_access_log
+        )
+        return
     
     app = create_app()
     
@@ -20,9 +45,10 @@ def main():
         app,
         host=args.host,
         port=args.port,
-        reload=args.reload
+        reload=args.reload,
+        access_log=not args.no_access_log
     )
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,11 +1,14 @@
 """MCP protocol models."""
 
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel
+from typing import Any, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, TypeAdapter, with_config
+from typing_extensions import Annotated, Required, TypedDict
 
 
 class MCPRequest(BaseModel):
     """MCP request model."""
+    model_config = ConfigDict(frozen=True)
+    
     jsonrpc: str = "2.0"
     id: Optional[Union[str, int]] = None
     method: str
@@ -19,8 +22,7 @@ class MCPResponse(BaseModel):
     result: Optional[Dict[str, Any]] = None
     error: Optional[Dict[str, Any]] = None
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
     
     def model_dump(self, **kwargs):
         """Override to ensure only result OR error is present, never both."""
@@ -51,6 +53,8 @@ class InitializeResult(BaseModel):
 
 class Tool(BaseModel):
     """Tool definition model."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     name: str
     description: str
     inputSchema: Dict[str, Any]
@@ -61,13 +65,126 @@ class ListToolsResult(BaseModel):
     tools: List[Tool]
 
 
+class ToolSchemaRequest(BaseModel):
+    """Get tool schema request."""
+    name: str
+
+
 class CallToolRequest(BaseModel):
     """Call tool request."""
     name: str
     arguments: Dict[str, Any]
 
 
+class TextContent(BaseModel):
+    """Text content item."""
+    model_config = ConfigDict(extra="forbid")
+    
+    type: Literal["text"]
+    text: str
+
+
+class ImageContent(BaseModel):
+    """Base64-encoded image content item."""
+    model_config = ConfigDict(extra="forbid")
+    
+    type: Literal["image"]
+    data: str
+    mimeType: str
+
+
+Content = Annotated[Union[TextContent, ImageContent], Field(discriminator="type")]
+
+
 class CallToolResult(BaseModel):
     """Call tool result."""
-    content: List[Dict[str, Any]]
-    isError: bool = False
\ No newline at end of file
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
+    content: List[Content]
+    isError: bool = False
+
+
+# Zabbix ids are strings, but accept the numbers clients often send instead
+@with_config(ConfigDict(coerce_numbers_to_str=True))
+class CreateHostArgs(TypedDict, total=False):
+    """zabbix_create_host arguments."""
+    host_name: Required[str]
+    visible_name: Required[str]
+    group_ids: Required[List[str]]
+    ip_address: Required[str]
+    server_id: Optional[str]
+    port: int
+
+
+@with_config(ConfigDict(extra="allow", coerce_numbers_to_str=True))
+class UpdateHostArgs(TypedDict, total=False):
+    """zabbix_update_host arguments; other fields are passed on to host.update."""
+    host_id: Required[str]
+    server_id: Optional[str]
+    host_name: str
+    visible_name: str
+    status: int
+
+
+@with_config(ConfigDict(coerce_numbers_to_str=True))
+class DeleteHostArgs(TypedDict, total=False):
+    """zabbix_delete_host arguments."""
+    host_ids: Required[List[str]]
+    server_id: Optional[str]
+
+
+class ExecuteOnAllNodesArgs(TypedDict, total=False):
+    """zabbix_execute_on_all_nodes arguments."""
+    method: Required[str]
+    params: Dict[str, Any]
+
+
+class InitializeRequest(MCPRequest):
+    """initialize request."""
+    method: Literal["initialize"]
+
+
+class ToolsListRequest(MCPRequest):
+    """tools/list request."""
+    method: Literal["tools/list"]
+
+
+class ToolsCallRequest(MCPRequest):
+    """tools/call request with typed params."""
+    method: Literal["tools/call"]
+    params: Optional[CallToolRequest] = None
+
+
+class ToolsGetSchemaRequest(MCPRequest):
+    """tools/get_schema request with typed params."""
+    method: Literal["tools/get_schema"]
+    params: Optional[ToolSchemaRequest] = None
+
+
+_KNOWN_METHODS = frozenset({"initialize", "tools/list", "tools/call", "tools/get_schema"})
+
+
+def _request_tag(value: Any) -> str:
+    """Pick the request variant from the method name; unknown methods use MCPRequest."""
+    if isinstance(value, dict):
+        method = value.get("method")
+    else:
+        method = getattr(value, "method", None)
+    return method if method in _KNOWN_METHODS else "other"
+
+
+AnyMCPRequest = Annotated[
+    Union[
+        Annotated[InitializeRequest, Tag("initialize")],
+        Annotated[ToolsListRequest, Tag("tools/list")],
+        Annotated[ToolsCallRequest, Tag("tools/call")],
+        Annotated[ToolsGetSchemaRequest, Tag("tools/get_schema")],
+        Annotated[MCPRequest, Tag("other")],
+    ],
+    Discriminator(_request_tag),
+]
+
+# Module-level adapters reuse one compiled validator/serializer per type
+MCP_REQUEST_ADAPTER = TypeAdapter(AnyMCPRequest)
+MCP_RESPONSE_ADAPTER = TypeAdapter(MCPResponse)
+CALL_TOOL_RESULT_ADAPTER = TypeAdapter(CallToolResult)
@@ -1,434 +1,603 @@
 """Minimal MCP server implementation."""
 
-import json
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Tuple, Union
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
-from pydantic import ValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json, to_json
 
 from .models import (
-    MCPRequest, MCPResponse, MCPError, InitializeResult, 
-    ServerInfo, Tool, ListToolsResult, CallToolRequest, CallToolResult
+    MCPRequest, InitializeResult, 
+    ServerInfo, Tool, ListToolsResult, CallToolResult,
+    ToolsCallRequest, ToolsGetSchemaRequest, MCP_REQUEST_ADAPTER, CALL_TOOL_RESULT_ADAPTER,
+    CreateHostArgs, UpdateHostArgs, DeleteHostArgs, ExecuteOnAllNodesArgs
 )
-from .zabbix_client import ZabbixClient, ZabbixConfig
+from .cache import TTLCache
 from .config import load_config
-from .server_manager import ZabbixServerManager
 from .logging_config import setup_zabbix_logging
 
+if TYPE_CHECKING:
+    from .server_manager import ZabbixServerManager
 
-class MCPServer:
-    """Minimal MCP server."""
-    
-    def __init__(self, config_path: Optional[str] = None):
-        # Load configuration first
-        self.config = load_config(config_path)
-        
-        # Setup logging
-        setup_zabbix_logging(self.config.to_dict())
-        self.logger = logging.getLogger("mcp_server")
-        
-        self.app = FastAPI(title="Zabbix MCP Server", version="0.1.0")
-        self.setup_routes()
-        self.tools = self._register_tools()
-        
-        # Setup multi-server manager
-        self.server_manager = ZabbixServerManager(self.config)
-        self.logger.info("MCP Server initialized successfully")
-    
-    def _register_tools(self) -> List[Tool]:
-        """Register available tools."""
-        return [
-            Tool(
-                name="echo",
-                description="Echo back the input message",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "message": {
-                            "type": "string",
-                            "description": "Message to echo back"
-                        }
-                    },
-                    "required": ["message"]
-                }
-            ),
-            Tool(
-                name="ping",
-                description="Simple ping tool that returns pong",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="zabbix_list_servers",
-                description="List all configured Zabbix servers with their details. Returns complete server list in a single call - do not call repeatedly.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="zabbix_test_connection",
-                description="Test Zabbix server connectivity. Returns connection status for specified server or all servers. Call once per test - results are immediate.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "server_id": {
-                            "type": "string",
-                            "description": "Server ID to test (optional). If not specified, tests all configured servers. Use 'datacenter-beijing' for Beijing datacenter."
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="zabbix_get_server_info",
-                description="Get Zabbix server information including version and status. Returns immediate results - do not call multiple times for the same server.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "server_id": {
-                            "type": "string",
-                            "description": "Server ID (optional, defaults to first available server). Use 'datacenter-beijing' for Beijing datacenter."
-                        }
-                    },
-                    "required": []
+
+# Input schema shared by the tools that take no arguments
+_EMPTY_SCHEMA = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+
+# Tool definitions are static, so build them once at import time and share
+# the frozen instances between servers
+_TOOLS: Tuple[Tool, ...] = (
+    Tool(
+        name="echo",
+        description="Echo back the input message",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "Message to echo back"
                 }
-            ),
-            Tool(
-                name="zabbix_get_hosts",
-                description="Get monitored hosts from a Zabbix server. IMPORTANT: This tool returns complete results in a single call. Do NOT call this tool multiple times for the same query.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "server_id": {
-                            "type": "string",
-                            "description": "Zabbix server ID (optional, defaults to first available server). Use 'datacenter-beijing' for Beijing datacenter."
-                        }
-                    },
-                    "required": []
+            },
+            "required": ["message"]
+        }
+    ),
+    Tool(
+        name="ping",
+        description="Simple ping tool that returns pong",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="zabbix_list_servers",
+        description="List all configured Zabbix servers with their details. Returns complete server list in a single call - do not call repeatedly.",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="zabbix_test_connection",
+        description="Test Zabbix server connectivity. Returns connection status for specified server or all servers. Call once per test - results are immediate.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server_id": {
+                    "type": "string",
+                    "description": "Server ID to test (optional). If not specified, tests all configured servers. Use 'datacenter-beijing' for Beijing datacenter."
                 }
-            ),
-            Tool(
-                name="zabbix_create_host",
-                description="Create new monitored host",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "host_name": {
-                            "type": "string",
-                            "description": "Technical hostname (unique)"
-                        },
-                        "visible_name": {
-                            "type": "string",
-                            "description": "Display name"
-                        },
-                        "group_ids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Host group IDs"
-                        },
-                        "ip_address": {
-                            "type": "string",
-                            "description": "Host IP address"
-                        },
-                        "server_id": {
-                            "type": "string",
-                            "description": "Server ID (default: first available)"
-                        },
-                        "port": {
-                            "type": "integer",
-                            "description": "Agent port (default: 10050)"
-                        }
-                    },
-                    "required": ["host_name", "visible_name", "group_ids", "ip_address"]
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="zabbix_get_server_info",
+        description="Get Zabbix server information including version and status. Returns immediate results - do not call multiple times for the same server.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server_id": {
+                    "type": "string",
+                    "description": "Server ID (optional, defaults to first available server). Use 'datacenter-beijing' for Beijing datacenter."
                 }
-            ),
-            Tool(
-                name="zabbix_update_host",
-                description="Update existing host",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "host_id": {
-                            "type": "string",
-                            "description": "Host ID to update"
-                        },
-                        "host_name": {
-                            "type": "string",
-                            "description": "New hostname"
-                        },
-                        "visible_name": {
-                            "type": "string",
-                            "description": "New display name"
-                        },
-                        "status": {
-                            "type": "integer",
-                            "description": "Status: 0=enabled, 1=disabled"
-                        },
-                        "server_id": {
-                            "type": "string",
-                            "description": "Server ID (default: first available)"
-                        }
-                    },
-                    "required": ["host_id"]
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="zabbix_get_hosts",
+        description="Get monitored hosts from a Zabbix server. IMPORTANT: This tool returns complete results in a single call. Do NOT call this tool multiple times for the same query.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server_id": {
+                    "type": "string",
+                    "description": "Zabbix server ID (optional, defaults to first available server). Use 'datacenter-beijing' for Beijing datacenter."
                 }
-            ),
-            Tool(
-                name="zabbix_delete_host",
-                description="Delete hosts permanently",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "host_ids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Host IDs to delete"
-                        },
-                        "server_id": {
-                            "type": "string",
-                            "description": "Server ID (default: first available)"
-                        }
-                    },
-                    "required": ["host_ids"]
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="zabbix_create_host",
+        description="Create new monitored host",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "host_name": {
+                    "type": "string",
+                    "description": "Technical hostname (unique)"
+                },
+                "visible_name": {
+                    "type": "string",
+                    "description": "Display name"
+                },
+                "group_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Host group IDs"
+                },
+                "ip_address": {
+                    "type": "string",
+                    "description": "Host IP address"
+                },
+                "server_id": {
+                    "type": "string",
+                    "description": "Server ID (default: first available)"
+                },
+                "port": {
+                    "type": "integer",
+                    "description": "Agent port (default: 10050)"
                 }
-            ),
-            Tool(
-                name="zabbix_get_templates",
-                description="Get monitoring templates",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "server_id": {
-                            "type": "string",
-                            "description": "Server ID (default: first available)"
-                        }
-                    },
-                    "required": []
+            },
+            "required": ["host_name", "visible_name", "group_ids", "ip_address"]
+        }
+    ),
+    Tool(
+        name="zabbix_update_host",
+        description="Update existing host",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "host_id": {
+                    "type": "string",
+                    "description": "Host ID to update"
+                },
+                "host_name": {
+                    "type": "string",
+                    "description": "New hostname"
+                },
+                "visible_name": {
+                    "type": "string",
+                    "description": "New display name"
+                },
+                "status": {
+                    "type": "integer",
+                    "description": "Status: 0=enabled, 1=disabled"
+                },
+                "server_id": {
+                    "type": "string",
+                    "description": "Server ID (default: first available)"
                 }
-            ),
-            Tool(
-                name="zabbix_get_distributed_summary",
-                description="Get health summary from all servers",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
+            },
+            "required": ["host_id"]
+        }
+    ),
+    Tool(
+        name="zabbix_delete_host",
+        description="Delete hosts permanently",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "host_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Host IDs to delete"
+                },
+                "server_id": {
+                    "type": "string",
+                    "description": "Server ID (default: first available)"
                 }
-            ),
-            Tool(
-                name="zabbix_get_aggregated_hosts",
-                description="Get hosts from all servers",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
+            },
+            "required": ["host_ids"]
+        }
+    ),
+    Tool(
+        name="zabbix_get_templates",
+        description="Get monitoring templates",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server_id": {
+                    "type": "string",
+                    "description": "Server ID (default: first available)"
                 }
-            ),
-            Tool(
-                name="zabbix_get_problems",
-                description="获取或读取全部Zabbix服务器被监控主机的问题清单。支持从指定服务器或所有配置的服务器获取当前活动问题，包括告警事件、严重级别、确认状态、标签信息等详细数据。可用于告警处理、故障排查和监控分析。",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "server_id": {
-                            "type": "string",
-                            "description": "Zabbix server ID. If not specified, problems from all servers will be returned."
-                        },
-                        "sortfield": {
-                            "type": "string",
-                            "description": "Field to sort by (e.g., 'eventid', 'severity', 'clock')."
-                        },
-                        "sortorder": {
-                            "type": "string",
-                            "description": "Sort order ('ASC' or 'DESC')."
-                        }
-                    },
-                    "required": []
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="zabbix_get_distributed_summary",
+        description="Get health summary from all servers",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="zabbix_get_aggregated_hosts",
+        description="Get hosts from all servers",
+        inputSchema=_EMPTY_SCHEMA
+    ),
+    Tool(
+        name="zabbix_get_problems",
+        description="获取或读取全部Zabbix服务器被监控主机的问题清单。支持从指定服务器或所有配置的服务器获取当前活动问题，包括告警事件、严重级别、确认状态、标签信息等详细数据。可用于告警处理、故障排查和监控分析。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server_id": {
+                    "type": "string",
+                    "description": "Zabbix server ID. If not specified, problems from all servers will be returned."
+                },
+                "sortfield": {
+                    "type": "string",
+                    "description": "Field to sort by (e.g., 'eventid', 'severity', 'clock')."
+                },
+                "sortorder": {
+                    "type": "string",
+                    "description": "Sort order ('ASC' or 'DESC')."
                 }
-            ),
-            Tool(
-                name="zabbix_execute_on_all_nodes",
-                description="Execute API call on all servers",
-                inputSchema={
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="zabbix_execute_on_all_nodes",
+        description="Execute API call on all servers",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "method": {
+                    "type": "string",
+                    "description": "Zabbix API method (e.g., 'host.get')"
+                },
+                "params": {
                     "type": "object",
-                    "properties": {
-                        "method": {
-                            "type": "string",
-                            "description": "Zabbix API method (e.g., 'host.get')"
-                        },
-                        "params": {
-                            "type": "object",
-                            "description": "API parameters (optional)"
-                        }
-                    },
-                    "required": ["method"]
+                    "description": "API parameters (optional)"
                 }
-            ),
-            Tool(
-                name="zabbix_get_items",
-                description="Get monitoring items from a Zabbix server.",
-                inputSchema={
+            },
+            "required": ["method"]
+        }
+    ),
+    Tool(
+        name="zabbix_get_items",
+        description="Get monitoring items from a Zabbix server.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server_id": {
+                    "type": "string",
+                    "description": "Zabbix server ID (optional, defaults to first available server)."
+                },
+                "hostids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Host IDs to get items for."
+                },
+                "search": {
                     "type": "object",
-                    "properties": {
-                        "server_id": {
-                            "type": "string",
-                            "description": "Zabbix server ID (optional, defaults to first available server)."
-                        },
-                        "hostids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Host IDs to get items for."
-                        },
-                        "search": {
-                            "type": "object",
-                            "description": "Search parameters (e.g., {'name': 'CPU utilization'})."
-                        },
-                        "output": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Fields to return."
-                        },
-                        "sortfield": {
-                            "type": "string",
-                            "description": "Field to sort by (e.g., 'name', 'key_')."
-                        },
-                        "sortorder": {
-                            "type": "string",
-                            "description": "Sort order ('ASC' or 'DESC')."
-                        }
-                    },
-                    "required": ["hostids"]
+                    "description": "Search parameters (e.g., {'name': 'CPU utilization'})."
+                },
+                "output": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Fields to return."
+                },
+                "sortfield": {
+                    "type": "string",
+                    "description": "Field to sort by (e.g., 'name', 'key_')."
+                },
+                "sortorder": {
+                    "type": "string",
+                    "description": "Sort order ('ASC' or 'DESC')."
                 }
-            ),
-            Tool(
-                name="zabbix_get_templates_by_host",
-                description="Get monitoring templates assigned to a specific host.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "server_id": {
-                            "type": "string",
-                            "description": "Zabbix server ID (optional, defaults to first available server)."
-                        },
-                        "host_name": {
-                            "type": "string",
-                            "description": "Technical host name to query templates for."
-                        },
-                        "host_id": {
-                            "type": "string",
-                            "description": "Host ID to query templates for (takes precedence over host_name)."
-                        }
-                    },
-                    "required": []
+            },
+            "required": ["hostids"]
+        }
+    ),
+    Tool(
+        name="zabbix_get_templates_by_host",
+        description="Get monitoring templates assigned to a specific host.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server_id": {
+                    "type": "string",
+                    "description": "Zabbix server ID (optional, defaults to first available server)."
+                },
+                "host_name": {
+                    "type": "string",
+                    "description": "Technical host name to query templates for."
+                },
+                "host_id": {
+                    "type": "string",
+                    "description": "Host ID to query templates for (takes precedence over host_name)."
                 }
-            ),
-            Tool(
-                name="zabbix_get_hosts_by_server",
-                description="Get monitored hosts from a specific Zabbix server. Returns complete results in a single call.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "server_id": {
-                            "type": "string",
-                            "description": "Zabbix server ID (required). Use specific server ID like 'datacenter-beijing' to get hosts from that server."
-                        },
-                        "output": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Fields to return (optional). Default: ['hostid', 'host', 'name', 'status']"
-                        },
-                        "selectGroups": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Host group fields to return (optional). Default: ['groupid', 'name']"
-                        }
-                    },
-                    "required": ["server_id"]
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="zabbix_get_hosts_by_server",
+        description="Get monitored hosts from a specific Zabbix server. Returns complete results in a single call.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server_id": {
+                    "type": "string",
+                    "description": "Zabbix server ID (required). Use specific server ID like 'datacenter-beijing' to get hosts from that server."
+                },
+                "output": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Fields to return (optional). Default: ['hostid', 'host', 'name', 'status']"
+                },
+                "selectGroups": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Host group fields to return (optional). Default: ['groupid', 'name']"
                 }
-            ),
-            Tool(
-                name="zabbix_get_problems_by_server",
-                description="Get current problems from a specific Zabbix server. Returns complete results in a single call.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "server_id": {
-                            "type": "string",
-                            "description": "Zabbix server ID (required). Use specific server ID like 'datacenter-beijing' to get problems from that server."
-                        },
-                        "sortfield": {
-                            "type": "string",
-                            "description": "Field to sort by (e.g., 'eventid', 'severity', 'clock')."
-                        },
-                        "sortorder": {
-                            "type": "string",
-                            "description": "Sort order ('ASC' or 'DESC')."
-                        },
-                        "output": {
-                            "type": "string",
-                            "description": "Output format ('extend' for full details, 'count' for count only). Default: 'extend'"
-                        },
-                        "selectAcknowledges": {
-                            "type": "string",
-                            "description": "Include acknowledgment information ('extend' or 'count'). Default: 'extend'"
-                        },
-                        "selectTags": {
-                            "type": "string",
-                            "description": "Include tag information ('extend' or 'count'). Default: 'extend'"
-                        }
-                    },
-                    "required": ["server_id"]
+            },
+            "required": ["server_id"]
+        }
+    ),
+    Tool(
+        name="zabbix_get_problems_by_server",
+        description="Get current problems from a specific Zabbix server. Returns complete results in a single call.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server_id": {
+                    "type": "string",
+                    "description": "Zabbix server ID (required). Use specific server ID like 'datacenter-beijing' to get problems from that server."
+                },
+                "sortfield": {
+                    "type": "string",
+                    "description": "Field to sort by (e.g., 'eventid', 'severity', 'clock')."
+                },
+                "sortorder": {
+                    "type": "string",
+                    "description": "Sort order ('ASC' or 'DESC')."
+                },
+                "output": {
+                    "type": "string",
+                    "description": "Output format ('extend' for full details, 'count' for count only). Default: 'extend'"
+                },
+                "selectAcknowledges": {
+                    "type": "string",
+                    "description": "Include acknowledgment information ('extend' or 'count'). Default: 'extend'"
+                },
+                "selectTags": {
+                    "type": "string",
+                    "description": "Include tag information ('extend' or 'count'). Default: 'extend'"
                 }
-            ),
-            Tool(
-                name="zabbix_get_host_problems_by_server",
-                description="Get current problems for a specific host from a specific Zabbix server. Returns complete results in a single call.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "server_id": {
-                            "type": "string",
-                            "description": "Zabbix server ID (required). Use specific server ID like 'datacenter-beijing'."
-                        },
-                        "host_name": {
-                            "type": "string",
-                            "description": "Technical host name to query problems for."
-                        },
-                        "host_id": {
-                            "type": "string",
-                            "description": "Host ID to query problems for (takes precedence over host_name)."
-                        },
-                        "sortfield": {
-                            "type": "string",
-                            "description": "Field to sort by (e.g., 'eventid', 'severity', 'clock')."
-                        },
-                        "sortorder": {
-                            "type": "string",
-                            "description": "Sort order ('ASC' or 'DESC')."
-                        },
-                        "output": {
-                            "type": "string",
-                            "description": "Output format ('extend' for full details, 'count' for count only). Default: 'extend'"
-                        },
-                        "selectAcknowledges": {
-                            "type": "string",
-                            "description": "Include acknowledgment information ('extend' or 'count'). Default: 'extend'"
-                        },
-                        "selectTags": {
-                            "type": "string",
-                            "description": "Include tag information ('extend' or 'count'). Default: 'extend'"
-                        }
-                    },
-                    "required": ["server_id"]
+            },
+            "required": ["server_id"]
+        }
+    ),
+    Tool(
+        name="zabbix_get_host_problems_by_server",
+        description="Get current problems for a specific host from a specific Zabbix server. Returns complete results in a single call.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "server_id": {
+                    "type": "string",
+                    "description": "Zabbix server ID (required). Use specific server ID like 'datacenter-beijing'."
+                },
+                "host_name": {
+                    "type": "string",
+                    "description": "Technical host name to query problems for."
+                },
+                "host_id": {
+                    "type": "string",
+                    "description": "Host ID to query problems for (takes precedence over host_name)."
+                },
+                "sortfield": {
+                    "type": "string",
+                    "description": "Field to sort by (e.g., 'eventid', 'severity', 'clock')."
+                },
+                "sortorder": {
+                    "type": "string",
+                    "description": "Sort order ('ASC' or 'DESC')."
+                },
+                "output": {
+                    "type": "string",
+                    "description": "Output format ('extend' for full details, 'count' for count only). Default: 'extend'"
+                },
+                "selectAcknowledges": {
+                    "type": "string",
+                    "description": "Include acknowledgment information ('extend' or 'count'). Default: 'extend'"
+                },
+                "selectTags": {
+                    "type": "string",
+                    "description": "Include tag information ('extend' or 'count'). Default: 'extend'"
                 }
-            )
-        ]
+            },
+            "required": ["server_id"]
+        }
+    ),
+)
+
+# tools/list and initialize results never change; serialize them once and
+# splice the per-request id into the envelope
+_LIST_TOOLS_RESULT_JSON = to_json(ListToolsResult(tools=list(_TOOLS)))
+_INITIALIZE_RESULT_JSON = to_json(InitializeResult(
+    protocolVersion="2024-11-05",
+    capabilities={
+        "tools": {}
+    },
+    serverInfo=ServerInfo(
+        name="zbx-mcp-server",
+        version="0.1.0"
+    )
+))
+
+_PING_RESULT_JSON = to_json(CallToolResult(content=[{"type": "text", "text": "pong"}]))
+
+# tools/list with {"summary": true} leaves out the input schemas; clients then
+# fetch the schema of each tool they use with tools/get_schema
+_TOOL_SUMMARIES_RESULT_JSON = to_json({
+    "tools": [tool.model_dump(include={"name", "description"}) for tool in _TOOLS]
+})
+_TOOL_SCHEMA_RESULT_JSON: Dict[str, bytes] = {
+    tool.name: to_json(tool.model_dump(include={"name", "inputSchema"})) for tool in _TOOLS
+}
+
+
+# Read-only tools whose results are reused for ServerConfig.tool_cache_ttl
+# seconds, and the host writes that make cached results stale; a
+# zabbix_execute_on_all_nodes call can write too unless its method is a *.get
+_CACHED_TOOLS = frozenset({
+    "zabbix_get_hosts",
+    "zabbix_get_templates",
+    "zabbix_get_distributed_summary",
+    "zabbix_get_aggregated_hosts",
+})
+_HOST_WRITE_TOOLS = frozenset({"zabbix_create_host", "zabbix_update_host", "zabbix_delete_host"})
+
+# Compiled argument validators for the tools that write or take free-form input
+_TOOL_ARG_ADAPTERS: Dict[str, TypeAdapter] = {
+    "zabbix_create_host": TypeAdapter(CreateHostArgs),
+    "zabbix_update_host": TypeAdapter(UpdateHostArgs),
+    "zabbix_delete_host": TypeAdapter(DeleteHostArgs),
+    "zabbix_execute_on_all_nodes": TypeAdapter(ExecuteOnAllNodesArgs),
+}
+
+# Largest JSON-RPC batch accepted, and how many of its requests run at once
+_MAX_BATCH_SIZE = 100
+_BATCH_CONCURRENCY = 8
+
+# Streamed tool responses are flushed in chunks of about this many bytes
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class ToolArgumentError(ValueError):
+    """Tool arguments failed a check the input schema cannot express."""
+
+
+class _TextResult:
+    """Tool result holding a single text content item.
+    
+    Nearly every tool answers with one text block, so it is encoded from a
+    byte template instead of building and serializing a CallToolResult.
+    """
+    
+    __slots__ = ("text",)
+    
+    def __init__(self, text: str):
+        self.text = text
+    
+    def to_json(self) -> bytes:
+        """Serialize to the same bytes as the equivalent CallToolResult."""
+        return b'{"content":[{"type":"text","text":' + orjson.dumps(self.text) + b'}],"isError":false}'
+
+
+class _StreamedJsonResult:
+    """Tool result for JSON data that is encoded while it streams out.
+    
+    The data becomes the same JSON text result that _json_result builds, but
+    the text is never held in memory as a whole. Lists and dicts are split
+    into their members down to depth levels; anything deeper is encoded in one
+    piece, so depth 1 streams a list of records one record at a time and
+    depth 2 streams an execute_on_all_nodes result one node at a time.
+    
+    The data is encoded once when the result is created and the output is
+    discarded, so data that orjson rejects fails the tool call with a
+    JSON-RPC error instead of cutting off a response that is already under way.
+    """
+    
+    __slots__ = ("data", "depth")
+    
+    def __init__(self, data: Any, depth: int = 1):
+        self.data = data
+        self.depth = depth
+        for _ in self.pieces():
+            pass
+    
+    def pieces(self) -> Iterator[bytes]:
+        """Yield the compact JSON encoding of the data in pieces."""
+        return self._iter_json(self.data, self.depth)
+    
+    @classmethod
+    def _iter_json(cls, value: Any, depth: int) -> Iterator[bytes]:
+        """Yield the compact JSON encoding of value in pieces, splitting containers down to depth levels."""
+        if depth > 0 and isinstance(value, dict):
+            yield b"{"
+            for index, (key, item) in enumerate(value.items()):
+                # Encode the key the way orjson would inside the dict, so
+                # non-string keys match OPT_NON_STR_KEYS output
+                key_json = orjson.dumps({key: None}, option=orjson.OPT_NON_STR_KEYS)[1:-5]
+                yield (b"," + key_json) if index else key_json
+                yield from cls._iter_json(item, depth - 1)
+            yield b"}"
+        elif depth > 0 and isinstance(value, list):
+            yield b"["
+            for index, item in enumerate(value):
+                if index:
+                    yield b","
+                yield from cls._iter_json(item, depth - 1)
+            yield b"]"
+        else:
+            yield orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MCPServer:
+    """Minimal MCP server."""
+    
+    def __init__(self, config_path: Optional[str] = None):
+        # Load configuration first
+        self.config = load_config(config_path)
+        
+        # Setup logging
+        setup_zabbix_logging(self.config.to_dict())
+        self.logger = logging.getLogger("mcp_server")
+        
+        self.app = FastAPI(title="Zabbix MCP Server", version="0.1.0", lifespan=self._lifespan)
+        self.setup_routes()
+        self.tools = self._register_tools()
+        cache_ttl = self.config.server.tool_cache_ttl
+        self._tool_cache = TTLCache(cache_ttl) if cache_ttl > 0 else None
+        self._method_handlers = {
+            "initialize": self._handle_initialize,
+            "tools/list": self._handle_list_tools,
+            "tools/call": self._handle_call_tool,
+            "tools/get_schema": self._handle_get_tool_schema,
+        }
+        self._tool_handlers = {
+            "echo": self._tool_echo,
+            "ping": self._tool_ping,
+            "zabbix_list_servers": self._tool_list_servers,
+            "zabbix_test_connection": self._tool_test_connection,
+            "zabbix_get_server_info": self._tool_get_server_info,
+            "zabbix_get_hosts": self._tool_get_hosts,
+            "zabbix_create_host": self._tool_create_host,
+            "zabbix_update_host": self._tool_update_host,
+            "zabbix_delete_host": self._tool_delete_host,
+            "zabbix_get_templates": self._tool_get_templates,
+            "zabbix_get_distributed_summary": self._tool_get_distributed_summary,
+            "zabbix_get_aggregated_hosts": self._tool_get_aggregated_hosts,
+            "zabbix_get_problems": self._tool_get_problems,
+            "zabbix_execute_on_all_nodes": self._tool_execute_on_all_nodes,
+            "zabbix_get_items": self._tool_get_items,
+            "zabbix_get_templates_by_host": self._tool_get_templates_by_host,
+            "zabbix_get_hosts_by_server": self._tool_get_hosts_by_server,
+            "zabbix_get_problems_by_server": self._tool_get_problems_by_server,
+            "zabbix_get_host_problems_by_server": self._tool_get_host_problems_by_server,
+        }
+        
+        self.logger.info("MCP Server initialized successfully")
+    
+    @cached_property
+    def server_manager(self) -> "ZabbixServerManager":
+        """Multi-server manager, created on the first Zabbix tool call."""
+        # Imported here so the Zabbix client and httpx are only loaded by
+        # processes that actually talk to Zabbix
+        from .server_manager import ZabbixServerManager
+        return ZabbixServerManager(self.config)
+    
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        """Close the pooled Zabbix connections when the app shuts down."""
+        yield
+        # Only a manager that was actually created can hold open connections
+        if "server_manager" in vars(self):
+            await self.server_manager.disconnect_all()
+    
+    def _register_tools(self) -> Tuple[Tool, ...]:
+        """Register available tools."""
+        return _TOOLS
     
     def setup_routes(self):
         """Setup FastAPI routes."""
@@ -436,409 +605,513 @@ class MCPServer:
         @self.app.post("/")
         async def handle_mcp_request(request: Request):
             """Handle MCP JSON-RPC requests."""
-            body = None
-            request_id = None
+            body = await request.body()
+            if body.lstrip()[:1] == b"[":
+                return await self._handle_batch(body)
+            
             try:
-                body = await request.json()
-                request_id = body.get("id") if isinstance(body, dict) else None
-
-                if "jsonrpc" not in body:
-                    raise ValueError("jsonrpc field is required")
-                mcp_request = MCPRequest(**body)
-
-                # Handle different MCP methods
-                if mcp_request.method == "initialize":
-                    result = self._handle_initialize(mcp_request)
-                elif mcp_request.method == "tools/list":
-                    result = self._handle_list_tools(mcp_request)
-                elif mcp_request.method == "tools/call":
-                    result = await self._handle_call_tool(mcp_request)
-                else:
-                    result = self._create_error_response(
-                        mcp_request.id, -32601, f"Method not found: {mcp_request.method}"
-                    )
-
-                return JSONResponse(content=result.model_dump())
-
+                # Parse and validate in one pass; the method picks the request type.
+                # JSON-RPC fields are already JSON-typed, so skip lax coercion.
+                mcp_request = MCP_REQUEST_ADAPTER.validate_json(body, strict=True)
             except ValidationError as e:
-                error_response = self._create_error_response(
-                    request_id, -32603, f"Invalid Request: {e.errors()[0]['msg']}"
-                )
-                return JSONResponse(content=error_response.model_dump())
-            except json.JSONDecodeError:
-                error_response = self._create_error_response(
-                    None, -32700, "Parse error: Invalid JSON was received by the server."
-                )
-                return JSONResponse(content=error_response.model_dump())
-            except Exception as e:
-                error_response = self._create_error_response(
-                    request_id, -32603, f"Invalid Request: {str(e)}"
-                )
-                return JSONResponse(content=error_response.model_dump())
-    
-    def _handle_initialize(self, request: MCPRequest) -> MCPResponse:
-        """Handle initialize method."""
-        result = InitializeResult(
-            protocolVersion="2024-11-05",
-            capabilities={
-                "tools": {}
-            },
-            serverInfo=ServerInfo(
-                name="zbx-mcp-server",
-                version="0.1.0"
+                if e.errors()[0]["type"] == "json_invalid":
+                    return self._parse_error_response()
+                return self._validation_error_response(e, from_json(body))
+            
+            return await self._dispatch(mcp_request)
+    
+    async def _handle_batch(self, body: bytes) -> Response:
+        """Run the requests of a JSON-RPC batch concurrently and reply with an array."""
+        try:
+            items = from_json(body)
+        except ValueError:
+            return self._parse_error_response()
+        if not items:
+            return self._create_error_response(None, -32600, "Invalid Request: empty batch")
+        if len(items) > _MAX_BATCH_SIZE:
+            return self._create_error_response(
+                None, -32600, f"Invalid Request: batch exceeds {_MAX_BATCH_SIZE} requests"
             )
-        )
         
-        return MCPResponse(
-            id=request.id,
-            result=result.model_dump()
+        # Bound the tool calls in flight, as ZabbixServerManager does for node fan-out
+        semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+        
+        async def run(item: Any) -> bytes:
+            async with semaphore:
+                response = await self._dispatch_item(item)
+                try:
+                    return await self._response_body(response)
+                except Exception as e:
+                    # A body that fails while it is drained only spoils its own entry
+                    return self._create_error_response(
+                        self._request_id_from(item), -32603, f"Internal error: {str(e)}"
+                    ).body
+        
+        bodies = await asyncio.gather(*(run(item) for item in items))
+        return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json")
+    
+    async def _dispatch_item(self, item: Any) -> Response:
+        """Validate and dispatch one already-parsed request of a batch."""
+        try:
+            mcp_request = MCP_REQUEST_ADAPTER.validate_python(item, strict=True)
+        except ValidationError as e:
+            return self._validation_error_response(e, item)
+        return await self._dispatch(mcp_request)
+    
+    @staticmethod
+    async def _response_body(response: Response) -> bytes:
+        """Collect the body of a response, draining it if it is streamed."""
+        if isinstance(response, StreamingResponse):
+            return b"".join([chunk async for chunk in response.body_iterator])
+        return response.body
+    
+    async def _dispatch(self, mcp_request: MCPRequest) -> Response:
+        """Route a validated request to its method handler."""
+        if "jsonrpc" not in mcp_request.model_fields_set:
+            return self._create_error_response(
+                mcp_request.id, -32603, "Invalid Request: jsonrpc field is required"
+            )
+        
+        handler = self._method_handlers.get(mcp_request.method)
+        if handler is None:
+            return self._create_error_response(
+                mcp_request.id, -32601, f"Method not found: {mcp_request.method}"
+            )
+        
+        try:
+            return await handler(mcp_request)
+        except Exception as e:
+            return self._create_error_response(
+                mcp_request.id, -32603, f"Invalid Request: {str(e)}"
+            )
+    
+    def _parse_error_response(self) -> Response:
+        """Error reply for a body that is not valid JSON."""
+        return self._create_error_response(
+            None, -32700, "Parse error: Invalid JSON was received by the server."
+        )
+    
+    def _validation_error_response(self, e: ValidationError, data: Any) -> Response:
+        """Map a parsed request that failed validation to its JSON-RPC error."""
+        error = e.errors()[0]
+        # Validation failed, so recover the id from the raw JSON for the error reply
+        request_id = self._request_id_from(data)
+        if error["loc"][:2] == ("tools/call", "params"):
+            return self._create_error_response(
+                request_id, -32602, f"Invalid tool call: {error['msg']}"
+            )
+        if error["loc"][:2] == ("tools/get_schema", "params"):
+            return self._create_error_response(
+                request_id, -32602, f"Invalid params: {error['msg']}"
+            )
+        return self._create_error_response(
+            request_id, -32603, f"Invalid Request: {error['msg']}"
         )
     
-    def _handle_list_tools(self, request: MCPRequest) -> MCPResponse:
+    @staticmethod
+    def _request_id_from(data: Any) -> Optional[Union[str, int]]:
+        """Best-effort id lookup in request data that failed validation."""
+        request_id = data.get("id") if isinstance(data, dict) else None
+        return request_id if isinstance(request_id, (str, int)) else None
+    
+    async def _handle_initialize(self, request: MCPRequest) -> Response:
+        """Handle initialize method."""
+        return self._result_response(request.id, _INITIALIZE_RESULT_JSON)
+    
+    async def _handle_list_tools(self, request: MCPRequest) -> Response:
         """Handle tools/list method."""
-        result = ListToolsResult(tools=self.tools)
+        if request.params and request.params.get("summary") is True:
+            return self._result_response(request.id, _TOOL_SUMMARIES_RESULT_JSON)
+        return self._result_response(request.id, _LIST_TOOLS_RESULT_JSON)
+    
+    async def _handle_get_tool_schema(self, request: ToolsGetSchemaRequest) -> Response:
+        """Handle tools/get_schema method."""
+        if not request.params:
+            return self._create_error_response(
+                request.id, -32602, "Missing params for tools/get_schema"
+            )
         
-        return MCPResponse(
-            id=request.id,
-            result=result.model_dump()
-        )
+        schema_json = _TOOL_SCHEMA_RESULT_JSON.get(request.params.name)
+        if schema_json is None:
+            return self._create_error_response(
+                request.id, -32602, f"Unknown tool: {request.params.name}"
+            )
+        return self._result_response(request.id, schema_json)
     
-    async def _handle_call_tool(self, request: MCPRequest) -> MCPResponse:
+    async def _handle_call_tool(self, request: ToolsCallRequest) -> Response:
         """Handle tools/call method."""
+        # ping is the liveness probe and its result never changes
+        if request.params is not None and request.params.name == "ping":
+            return self._result_response(request.id, _PING_RESULT_JSON)
+        return await self._call_tool(request)
+    
+    async def _call_tool(self, request: ToolsCallRequest) -> Response:
+        """Run the requested tool and build its JSON-RPC response."""
         if not request.params:
             return self._create_error_response(
                 request.id, -32602, "Missing params for tools/call"
             )
         
-        try:
-            tool_request = CallToolRequest(**request.params)
-            
-            # Execute the tool
-            if tool_request.name == "echo":
-                message = tool_request.arguments.get("message", "")
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": f"Echo: {message}"
-                    }]
-                )
-            elif tool_request.name == "ping":
-                result = CallToolResult(
-                    content=[{
-                        "type": "text", 
-                        "text": "pong"
-                    }]
-                )
-            elif tool_request.name == "zabbix_list_servers":
-                servers = self.server_manager.list_servers()
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(servers, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_test_connection":
-                server_id = tool_request.arguments.get("server_id")
-                connection_results = await self.server_manager.test_connection(server_id)
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(connection_results, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_server_info":
-                server_id = tool_request.arguments.get("server_id")
-                server_info = await self.server_manager.get_server_info(server_id)
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(server_info, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_hosts":
-                server_id = tool_request.arguments.get("server_id")
-                client = await self.server_manager.get_client(server_id)
-                
-                hosts = await client.get_hosts()
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(hosts, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_create_host":
-                args = tool_request.arguments
-                server_id = args.pop("server_id", None)
-                client = await self.server_manager.get_client(server_id)
-                
-                interfaces = [{
-                    "type": 1,  # Zabbix agent
-                    "main": 1,
-                    "useip": 1,
-                    "ip": args["ip_address"],
-                    "dns": "",
-                    "port": str(args.get("port", 10050))
-                }]
-                
-                created_host = await client.create_host(
-                    host_name=args["host_name"],
-                    visible_name=args["visible_name"],
-                    group_ids=args["group_ids"],
-                    interfaces=interfaces
-                )
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": f"Host created successfully: {json.dumps(created_host, indent=2)}"
-                    }]
-                )
-            elif tool_request.name == "zabbix_update_host":
-                args = tool_request.arguments
-                server_id = args.pop("server_id", None)
-                host_id = args.pop("host_id")
-                client = await self.server_manager.get_client(server_id)
-                
-                updated_host = await client.update_host(host_id, **args)
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": f"Host updated successfully: {json.dumps(updated_host, indent=2)}"
-                    }]
-                )
-            elif tool_request.name == "zabbix_delete_host":
-                server_id = tool_request.arguments.get("server_id")
-                host_ids = tool_request.arguments["host_ids"]
-                client = await self.server_manager.get_client(server_id)
-                deleted_hosts = await client.delete_host(host_ids)
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": f"Hosts deleted successfully: {json.dumps(deleted_hosts, indent=2)}"
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_templates":
-                server_id = tool_request.arguments.get("server_id")
-                client = await self.server_manager.get_client(server_id)
-                templates = await client.get_templates()
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(templates, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_distributed_summary":
-                summary = await self.server_manager.get_distributed_summary()
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(summary, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_aggregated_hosts":
-                aggregated_hosts = await self.server_manager.get_aggregated_hosts()
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(aggregated_hosts, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_problems":
-                server_id = tool_request.arguments.get("server_id")
-                sortfield = tool_request.arguments.get("sortfield")
-                sortorder = tool_request.arguments.get("sortorder")
-
-                if server_id:
-                    client = await self.server_manager.get_client(server_id)
-                    problems = await client.get_problems(sortfield=sortfield, sortorder=sortorder)
-                else:
-                    problems = await self.server_manager.execute_on_all_nodes(
-                        "problem.get", 
-                        params={
-                            "sortfield": sortfield,
-                            "sortorder": sortorder,
-                            "output": "extend",
-                            "selectAcknowledges": "extend",
-                            "selectTags": "extend",
-                            "selectSuppressionData": "extend"
-                        }
-                    )
-
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(problems, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_execute_on_all_nodes":
-                method = tool_request.arguments["method"]
-                params = tool_request.arguments.get("params", {})
-                execution_results = await self.server_manager.execute_on_all_nodes(method, params)
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(execution_results, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_items":
-                server_id = tool_request.arguments.get("server_id")
-                hostids = tool_request.arguments.get("hostids")
-                search = tool_request.arguments.get("search")
-                output = tool_request.arguments.get("output")
-                sortfield = tool_request.arguments.get("sortfield")
-                sortorder = tool_request.arguments.get("sortorder")
-                client = await self.server_manager.get_client(server_id)
-                items = await client.get_items(
-                    hostids=hostids,
-                    search=search,
-                    output=output,
-                    sortfield=sortfield,
-                    sortorder=sortorder
-                )
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(items, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_templates_by_host":
-                server_id = tool_request.arguments.get("server_id")
-                host_name = tool_request.arguments.get("host_name")
-                host_id = tool_request.arguments.get("host_id")
-                
-                if not host_id and not host_name:
-                    return self._create_error_response(
-                        request.id, -32602, "Either host_id or host_name must be provided"
-                    )
-                
-                client = await self.server_manager.get_client(server_id)
-                templates_info = await client.get_templates_by_host(
-                    host_name=host_name,
-                    host_id=host_id
-                )
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps(templates_info, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_hosts_by_server":
-                server_id = tool_request.arguments.get("server_id")
-                output = tool_request.arguments.get("output", ["hostid", "host", "name", "status"])
-                selectGroups = tool_request.arguments.get("selectGroups", ["groupid", "name"])
-                
-                if not server_id:
-                    return self._create_error_response(
-                        request.id, -32602, "server_id is required"
-                    )
-                
-                client = await self.server_manager.get_client(server_id)
-                hosts = await client.get_hosts(output=output, selectGroups=selectGroups)
-                
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps({
-                            "server_id": server_id,
-                            "server_name": self.server_manager.config.zabbix_servers[server_id].name,
-                            "hosts": hosts
-                        }, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_problems_by_server":
-                server_id = tool_request.arguments.get("server_id")
-                sortfield = tool_request.arguments.get("sortfield")
-                sortorder = tool_request.arguments.get("sortorder")
-                output = tool_request.arguments.get("output", "extend")
-                selectAcknowledges = tool_request.arguments.get("selectAcknowledges", "extend")
-                selectTags = tool_request.arguments.get("selectTags", "extend")
-                
-                if not server_id:
-                    return self._create_error_response(
-                        request.id, -32602, "server_id is required"
-                    )
-                
-                client = await self.server_manager.get_client(server_id)
-                problems = await client.get_problems(
-                    sortfield=sortfield,
-                    sortorder=sortorder,
-                    output=output,
-                    selectAcknowledges=selectAcknowledges,
-                    selectTags=selectTags
-                )
-                
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps({
-                            "server_id": server_id,
-                            "server_name": self.server_manager.config.zabbix_servers[server_id].name,
-                            "problems": problems,
-                            "problem_count": len(problems) if isinstance(problems, list) else 0
-                        }, indent=2, ensure_ascii=False)
-                    }]
-                )
-            elif tool_request.name == "zabbix_get_host_problems_by_server":
-                server_id = tool_request.arguments.get("server_id")
-                host_name = tool_request.arguments.get("host_name")
-                host_id = tool_request.arguments.get("host_id")
-                sortfield = tool_request.arguments.get("sortfield")
-                sortorder = tool_request.arguments.get("sortorder")
-                output = tool_request.arguments.get("output", "extend")
-                selectAcknowledges = tool_request.arguments.get("selectAcknowledges", "extend")
-                selectTags = tool_request.arguments.get("selectTags", "extend")
-                
-                if not server_id:
-                    return self._create_error_response(
-                        request.id, -32602, "server_id is required"
-                    )
-                
-                if not host_id and not host_name:
-                    return self._create_error_response(
-                        request.id, -32602, "Either host_id or host_name must be provided"
-                    )
-                
-                client = await self.server_manager.get_client(server_id)
-                host_problems = await client.get_host_problems(
-                    host_name=host_name,
-                    host_id=host_id,
-                    sortfield=sortfield,
-                    sortorder=sortorder,
-                    output=output,
-                    selectAcknowledges=selectAcknowledges,
-                    selectTags=selectTags
-                )
-                
-                result = CallToolResult(
-                    content=[{
-                        "type": "text",
-                        "text": json.dumps({
-                            "server_id": server_id,
-                            "server_name": self.server_manager.config.zabbix_servers[server_id].name,
-                            "host_problems": host_problems
-                        }, indent=2, ensure_ascii=False)
-                    }]
-                )
-            else:
-                return self._create_error_response(
-                    request.id, -32602, f"Unknown tool: {tool_request.name}"
-                )
-            
-            return MCPResponse(
-                id=request.id,
-                result=result.model_dump()
+        name = request.params.name
+        handler = self._tool_handlers.get(name)
+        if handler is None:
+            return self._create_error_response(
+                request.id, -32602, f"Unknown tool: {name}"
             )
-            
+        
+        try:
+            arguments = request.params.arguments
+            # Tools with an argument adapter are checked before the cache or
+            # the handler is reached, so handlers only see validated arguments
+            if name in _TOOL_ARG_ADAPTERS:
+                arguments = self._validate_args(name, arguments)
+            result = await self._run_tool(name, handler, arguments)
+        except ToolArgumentError as e:
+            return self._create_error_response(request.id, -32602, str(e))
         except Exception as e:
             return self._create_error_response(
                 request.id, -32602, f"Invalid tool call: {str(e)}"
             )
+        
+        if isinstance(result, _StreamedJsonResult):
+            return StreamingResponse(
+                self._stream_json(request.id, result),
+                media_type="application/json"
+            )
+        
+        if isinstance(result, _TextResult):
+            return self._result_response(request.id, result.to_json())
+        
+        # Encode the validated result to bytes once instead of dumping it to
+        # a dict and walking that dict again for the envelope
+        return self._result_response(
+            request.id, CALL_TOOL_RESULT_ADAPTER.dump_json(result)
+        )
+    
+    async def _run_tool(self, name: str, handler: Callable[[Dict[str, Any]], Awaitable[Any]],
+                        arguments: Dict[str, Any]) -> Any:
+        """Await a tool handler, serving read-only tools from the result cache."""
+        if self._tool_cache is None:
+            return await handler(arguments)
+        
+        if name in _CACHED_TOOLS:
+            # pydantic-core encodes anything that came in as JSON, including
+            # integers outside the 64-bit range that orjson rejects
+            key = (name, to_json(sorted(arguments.items())))
+            return await self._tool_cache.get_or_compute(key, lambda: handler(arguments))
+        
+        try:
+            return await handler(arguments)
+        finally:
+            # Drop cached host data even if the write failed part way
+            if self._invalidates_cache(name, arguments):
+                self._tool_cache.clear()
+    
+    @staticmethod
+    def _invalidates_cache(name: str, arguments: Dict[str, Any]) -> bool:
+        """Return whether a tool call may change data that cached tools return."""
+        if name == "zabbix_execute_on_all_nodes":
+            return not arguments["method"].endswith(".get")
+        return name in _HOST_WRITE_TOOLS
+    
+    @staticmethod
+    def _validate_args(tool_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate tool arguments into a new dict, reporting the first problem."""
+        try:
+            return _TOOL_ARG_ADAPTERS[tool_name].validate_python(args)
+        except ValidationError as e:
+            error = e.errors()[0]
+            field_path = ".".join(str(part) for part in error["loc"])
+            raise ToolArgumentError(
+                f"Invalid arguments for {tool_name}: {field_path}: {error['msg']}"
+            ) from None
+    
+    @staticmethod
+    def _text_result(text: str) -> _TextResult:
+        """Wrap text in a single-item tool result."""
+        return _TextResult(text)
+    
+    @staticmethod
+    def _json_text(data: Any) -> str:
+        """Encode tool data as compact JSON with orjson's C encoder.
+        
+        The text is escaped again when the response is serialized, so
+        indentation would cost its whitespace twice over for every record.
+        """
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    
+    def _json_result(self, data: Any) -> _TextResult:
+        """Wrap tool data as a JSON text result."""
+        return self._text_result(self._json_text(data))
+    
+    async def _tool_echo(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the echo tool."""
+        message = args.get("message", "")
+        return self._text_result(f"Echo: {message}")
+    
+    async def _tool_ping(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the ping tool."""
+        return self._text_result("pong")
+    
+    async def _tool_list_servers(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_list_servers tool."""
+        servers = self.server_manager.list_servers()
+        return self._json_result(servers)
+    
+    async def _tool_test_connection(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_test_connection tool."""
+        server_id = args.get("server_id")
+        connection_results = await self.server_manager.test_connection(server_id)
+        return self._json_result(connection_results)
+    
+    async def _tool_get_server_info(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_get_server_info tool."""
+        server_id = args.get("server_id")
+        server_info = await self.server_manager.get_server_info(server_id)
+        return self._json_result(server_info)
+    
+    async def _tool_get_hosts(self, args: Dict[str, Any]) -> _StreamedJsonResult:
+        """Handle the zabbix_get_hosts tool."""
+        server_id = args.get("server_id")
+        client = await self.server_manager.get_client(server_id)
+        
+        hosts = await client.get_hosts()
+        return _StreamedJsonResult(hosts)
+    
+    async def _tool_create_host(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_create_host tool."""
+        server_id = args.get("server_id")
+        client = await self.server_manager.get_client(server_id)
+        
+        interfaces = [{
+            "type": 1,  # Zabbix agent
+            "main": 1,
+            "useip": 1,
+            "ip": args["ip_address"],
+            "dns": "",
+            "port": str(args.get("port", 10050))
+        }]
+        
+        created_host = await client.create_host(
+            host_name=args["host_name"],
+            visible_name=args["visible_name"],
+            group_ids=args["group_ids"],
+            interfaces=interfaces
+        )
+        return self._text_result(f"Host created successfully: {self._json_text(created_host)}")
+    
+    async def _tool_update_host(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_update_host tool."""
+        client = await self.server_manager.get_client(args.get("server_id"))
+        
+        # Everything except the routing fields is passed on to host.update
+        update_fields = {
+            key: value for key, value in args.items() if key not in ("host_id", "server_id")
+        }
+        updated_host = await client.update_host(args["host_id"], **update_fields)
+        return self._text_result(f"Host updated successfully: {self._json_text(updated_host)}")
+    
+    async def _tool_delete_host(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_delete_host tool."""
+        server_id = args.get("server_id")
+        host_ids = args["host_ids"]
+        client = await self.server_manager.get_client(server_id)
+        deleted_hosts = await client.delete_host(host_ids)
+        return self._text_result(f"Hosts deleted successfully: {self._json_text(deleted_hosts)}")
+    
+    async def _tool_get_templates(self, args: Dict[str, Any]) -> _StreamedJsonResult:
+        """Handle the zabbix_get_templates tool."""
+        server_id = args.get("server_id")
+        client = await self.server_manager.get_client(server_id)
+        templates = await client.get_templates()
+        return _StreamedJsonResult(templates)
+    
+    async def _tool_get_distributed_summary(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_get_distributed_summary tool."""
+        summary = await self.server_manager.get_distributed_summary()
+        return self._json_result(summary)
+    
+    async def _tool_get_aggregated_hosts(self, args: Dict[str, Any]) -> _StreamedJsonResult:
+        """Handle the zabbix_get_aggregated_hosts tool."""
+        aggregated_hosts = await self.server_manager.get_aggregated_hosts()
+        return _StreamedJsonResult(aggregated_hosts, depth=2)
+    
+    async def _tool_get_problems(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_get_problems tool."""
+        server_id = args.get("server_id")
+        sortfield = args.get("sortfield")
+        sortorder = args.get("sortorder")
+
+        if server_id:
+            client = await self.server_manager.get_client(server_id)
+            problems = await client.get_problems(sortfield=sortfield, sortorder=sortorder)
+        else:
+            problems = await self.server_manager.execute_on_all_nodes(
+                "problem.get", 
+                params={
+                    "sortfield": sortfield,
+                    "sortorder": sortorder,
+                    "output": "extend",
+                    "selectAcknowledges": "extend",
+                    "selectTags": "extend",
+                    "selectSuppressionData": "extend"
+                }
+            )
+
+        return self._json_result(problems)
+    
+    async def _tool_execute_on_all_nodes(self, args: Dict[str, Any]) -> _StreamedJsonResult:
+        """Handle the zabbix_execute_on_all_nodes tool."""
+        method = args["method"]
+        params = args.get("params", {})
+        execution_results = await self.server_manager.execute_on_all_nodes(method, params)
+        return _StreamedJsonResult(execution_results, depth=2)
+    
+    async def _tool_get_items(self, args: Dict[str, Any]) -> _StreamedJsonResult:
+        """Handle the zabbix_get_items tool."""
+        server_id = args.get("server_id")
+        client = await self.server_manager.get_client(server_id)
+        items = await client.get_items(
+            hostids=args.get("hostids"),
+            search=args.get("search"),
+            output=args.get("output"),
+            sortfield=args.get("sortfield"),
+            sortorder=args.get("sortorder")
+        )
+        return _StreamedJsonResult(items)
+    
+    async def _tool_get_templates_by_host(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_get_templates_by_host tool."""
+        server_id = args.get("server_id")
+        host_name = args.get("host_name")
+        host_id = args.get("host_id")
+        
+        if not host_id and not host_name:
+            raise ToolArgumentError("Either host_id or host_name must be provided")
+        
+        client = await self.server_manager.get_client(server_id)
+        templates_info = await client.get_templates_by_host(
+            host_name=host_name,
+            host_id=host_id
+        )
+        return self._json_result(templates_info)
+    
+    async def _tool_get_hosts_by_server(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_get_hosts_by_server tool."""
+        server_id = args.get("server_id")
+        output = args.get("output", ["hostid", "host", "name", "status"])
+        selectGroups = args.get("selectGroups", ["groupid", "name"])
+        
+        if not server_id:
+            raise ToolArgumentError("server_id is required")
+        
+        client = await self.server_manager.get_client(server_id)
+        hosts = await client.get_hosts(output=output, selectGroups=selectGroups)
+        
+        return self._json_result({
+            "server_id": server_id,
+            "server_name": self.server_manager.config.zabbix_servers[server_id].name,
+            "hosts": hosts
+        })
+    
+    async def _tool_get_problems_by_server(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_get_problems_by_server tool."""
+        server_id = args.get("server_id")
+        
+        if not server_id:
+            raise ToolArgumentError("server_id is required")
+        
+        client = await self.server_manager.get_client(server_id)
+        problems = await client.get_problems(
+            sortfield=args.get("sortfield"),
+            sortorder=args.get("sortorder"),
+            output=args.get("output", "extend"),
+            selectAcknowledges=args.get("selectAcknowledges", "extend"),
+            selectTags=args.get("selectTags", "extend")
+        )
+        
+        return self._json_result({
+            "server_id": server_id,
+            "server_name": self.server_manager.config.zabbix_servers[server_id].name,
+            "problems": problems,
+            "problem_count": len(problems) if isinstance(problems, list) else 0
+        })
+    
+    async def _tool_get_host_problems_by_server(self, args: Dict[str, Any]) -> _TextResult:
+        """Handle the zabbix_get_host_problems_by_server tool."""
+        server_id = args.get("server_id")
+        host_name = args.get("host_name")
+        host_id = args.get("host_id")
+        
+        if not server_id:
+            raise ToolArgumentError("server_id is required")
+        
+        if not host_id and not host_name:
+            raise ToolArgumentError("Either host_id or host_name must be provided")
+        
+        client = await self.server_manager.get_client(server_id)
+        host_problems = await client.get_host_problems(
+            host_name=host_name,
+            host_id=host_id,
+            sortfield=args.get("sortfield"),
+            sortorder=args.get("sortorder"),
+            output=args.get("output", "extend"),
+            selectAcknowledges=args.get("selectAcknowledges", "extend"),
+            selectTags=args.get("selectTags", "extend")
+        )
+        
+        return self._json_result({
+            "server_id": server_id,
+            "server_name": self.server_manager.config.zabbix_servers[server_id].name,
+            "host_problems": host_problems
+        })
+    
+    @staticmethod
+    def _id_member(request_id: Optional[Union[str, int]]) -> bytes:
+        """Serialized id member of a JSON-RPC envelope, omitted when the id is None."""
+        return b"" if request_id is None else b'"id":' + orjson.dumps(request_id) + b","
+    
+    @classmethod
+    def _envelope_prefix(cls, request_id: Optional[Union[str, int]]) -> bytes:
+        """Opening bytes of a JSON-RPC result envelope, up to the result value."""
+        return b'{"jsonrpc":"2.0",' + cls._id_member(request_id) + b'"result":'
+    
+    def _result_response(self, request_id: Optional[Union[str, int]], result_json: bytes) -> Response:
+        """Wrap serialized result bytes in a JSON-RPC envelope, matching MCPResponse serialization."""
+        return Response(
+            content=self._envelope_prefix(request_id) + result_json + b"}",
+            media_type="application/json"
+        )
+    
+    def _stream_json(self, request_id: Optional[Union[str, int]], result: _StreamedJsonResult) -> Iterator[bytes]:
+        """Yield the response for a _StreamedJsonResult one chunk at a time.
+        
+        Each piece of the data is encoded and escaped into the text field on
+        its own, so the bytes match _result_response for the equivalent
+        _json_result.
+        """
+        yield self._envelope_prefix(request_id) + b'{"content":[{"type":"text","text":"'
+        
+        buffer = bytearray()
+        for piece in result.pieces():
+            # Escape the piece as string content, without the surrounding quotes
+            buffer += orjson.dumps(piece.decode("utf-8"))[1:-1]
+            if len(buffer) >= _STREAM_CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        
+        buffer += b'"}],"isError":false}}'
+        yield bytes(buffer)
     
-    def _create_error_response(self, request_id: Optional[str], code: int, message: str) -> MCPResponse:
+    def _create_error_response(self, request_id: Optional[Union[str, int]], code: int, message: str) -> Response:
         """Create an error response."""
-        return MCPResponse(
-            id=request_id,
-            error={"code": code, "message": message}
+        # Error replies have a fixed shape, so splice the id, code and message
+        # into the envelope bytes; this matches MCPResponse serialization
+        content = (
+            b'{"jsonrpc":"2.0",' + self._id_member(request_id)
+            + b'"error":{"code":%d,"message":' % code + orjson.dumps(message) + b"}}"
         )
+        return Response(content=content, media_type="application/json")
 
 
 def create_app(config_path: Optional[str] = None) -> FastAPI:
@@ -1,11 +1,14 @@
 """Distributed Zabbix server management for MCP Server."""
 
-from typing import Dict, Optional, List
+from typing import Any, Awaitable, Callable, Dict, Optional, List
 import asyncio
 import logging
 from .zabbix_client import ZabbixClient
 from .config import Config, ZabbixServerConfig, get_server_config
 
+# Upper bound on the nodes queried at once when a call fans out to all servers
+MAX_CONCURRENCY = 8
+
 
 class ZabbixServerManager:
     """Manages distributed Zabbix server nodes and connections."""
@@ -21,11 +24,16 @@ class ZabbixServerManager:
         if server_id is None:
             server_id = self.config.default_zabbix_server
         
-        if server_id not in self.config.zabbix_servers:
-            available_servers = list(self.config.zabbix_servers.keys())
-            error_msg = f"Server '{server_id}' not found. Available servers: {available_servers}"
-            self.logger.error(error_msg)
-            raise ValueError(error_msg)
+        try:
+            server_config = get_server_config(self.config, server_id)
+        except ValueError as e:
+            self.logger.error(str(e))
+            raise
+        
+        # Clients keep their connection pool open, so reuse one without locking
+        client = self._clients.get(server_id)
+        if client is not None:
+            return client
         
         # Create lock for this server if it doesn't exist
         if server_id not in self._client_locks:
@@ -34,7 +42,6 @@ class ZabbixServerManager:
         async with self._client_locks[server_id]:
             if server_id not in self._clients:
                 self.logger.info(f"Creating new Zabbix client for server: {server_id}")
-                server_config = self.config.zabbix_servers[server_id]
                 self._clients[server_id] = ZabbixClient(
                     url=server_config.url,
                     username=server_config.username,
@@ -73,14 +80,14 @@ class ZabbixServerManager:
         else:
             servers_to_test = list(self.config.zabbix_servers.keys())
         
-        for sid in servers_to_test:
-            try:
-                client = await self.get_client(sid)
-                # Try to make a simple API call to test the connection
-                await client.api_call("apiinfo.version")
-                results[sid] = True
-            except Exception:
-                results[sid] = False
+        async def check(sid: str) -> None:
+            client = await self.get_client(sid)
+            # Try to make a simple API call to test the connection
+            await client.api_call("apiinfo.version")
+        
+        outcomes = await self._gather_nodes(servers_to_test, check)
+        for sid, outcome in zip(servers_to_test, outcomes):
+            results[sid] = not isinstance(outcome, Exception)
         
         return results
     
@@ -136,6 +143,26 @@ class ZabbixServerManager:
         
         return server_id
     
+    async def _gather_nodes(self, server_ids: List[str], call: Callable[[str], Awaitable[Any]]) -> List[Any]:
+        """Run call(server_id) for every node concurrently, at most MAX_CONCURRENCY at a time.
+        
+        Results come back in server_ids order; a node that failed yields its
+        exception instead of a result, so one slow or broken node does not
+        hold up or abort the others.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        
+        async def run(server_id: str) -> Any:
+            async with semaphore:
+                return await call(server_id)
+        
+        outcomes = await asyncio.gather(*(run(sid) for sid in server_ids), return_exceptions=True)
+        for outcome in outcomes:
+            # Only Exceptions count as node failures; let cancellation through
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+        return outcomes
+    
     async def get_distributed_summary(self) -> Dict[str, any]:
         """Get a summary of all distributed Zabbix server nodes."""
         summary = {
@@ -146,21 +173,22 @@ class ZabbixServerManager:
         }
         
         connected_count = 0
-        for server_id in self.config.zabbix_servers.keys():
-            try:
-                server_info = await self.get_server_info(server_id)
+        server_ids = list(self.config.zabbix_servers.keys())
+        server_infos = await self._gather_nodes(server_ids, self.get_server_info)
+        for server_id, server_info in zip(server_ids, server_infos):
+            if isinstance(server_info, Exception):
                 summary["nodes"][server_id] = {
-                    "status": "online",
-                    "version": server_info.get("version", "unknown"),
+                    "status": "offline", 
+                    "error": str(server_info),
                     "name": self.config.zabbix_servers[server_id].name
                 }
-                connected_count += 1
-            except Exception as e:
+            else:
                 summary["nodes"][server_id] = {
-                    "status": "offline", 
-                    "error": str(e),
+                    "status": "online",
+                    "version": server_info.get("version", "unknown"),
                     "name": self.config.zabbix_servers[server_id].name
                 }
+                connected_count += 1
         
         if connected_count == len(self.config.zabbix_servers):
             summary["overall_status"] = "all_online"
@@ -182,19 +210,23 @@ class ZabbixServerManager:
         results = {}
         errors = {}
         
-        for server_id in self.config.zabbix_servers.keys():
-            try:
-                client = await self.get_client(server_id)
-                result = await client.api_call(method, params)
-                results[server_id] = {
-                    "status": "success",
-                    "data": result,
-                    "node_name": self.config.zabbix_servers[server_id].name
-                }
-            except Exception as e:
+        async def call(server_id: str) -> Any:
+            client = await self.get_client(server_id)
+            return await client.api_call(method, params)
+        
+        server_ids = list(self.config.zabbix_servers.keys())
+        outcomes = await self._gather_nodes(server_ids, call)
+        for server_id, outcome in zip(server_ids, outcomes):
+            if isinstance(outcome, Exception):
                 errors[server_id] = {
                     "status": "error",
-                    "error": str(e),
+                    "error": str(outcome),
+                    "node_name": self.config.zabbix_servers[server_id].name
+                }
+            else:
+                results[server_id] = {
+                    "status": "success",
+                    "data": outcome,
                     "node_name": self.config.zabbix_servers[server_id].name
                 }
         
@@ -1,11 +1,11 @@
 """Zabbix API client for host management operations."""
 
-import json
 import logging
 import time
 import asyncio
 from typing import Any, Dict, List, Optional
 import httpx
+import orjson
 from dataclasses import dataclass
 
 
@@ -21,6 +21,15 @@ class ZabbixConfig:
     retry_backoff: float = 1.0
 
 
+# Tool calls often arrive more than httpx's default 5s apart; keep idle
+# connections around long enough to skip the TCP/TLS handshake between them
+_CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=30.0
+)
+
+
 class ZabbixAPIError(Exception):
     """Zabbix API error."""
     pass
@@ -75,7 +84,8 @@ class ZabbixClient:
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=self.config.timeout,
-                verify=self.config.verify_ssl
+                verify=self.config.verify_ssl,
+                limits=_CONNECTION_LIMITS
             )
         return self._client
     
@@ -110,17 +120,22 @@ class ZabbixClient:
             
         self.request_id += 1
         
+        # Payload logging masks and encodes whole API results, so skip it
+        # unless the logger levels let those records through
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        access_enabled = self.access_logger.isEnabledFor(logging.INFO)
+        masked_request = self._mask_sensitive_data(request_data) if debug_enabled or access_enabled else None
+        
         # Retry logic with exponential backoff
         for attempt in range(max_retries + 1):
             start_time = time.time()
             
-            masked_request = self._mask_sensitive_data(request_data)
-            
             # Log request (only on first attempt to avoid spam)
             if attempt == 0:
                 self.logger.info(f"API Request: {method} - ID: {self.request_id-1} (max_retries={max_retries})")
-                self.logger.debug(f"Request URL: {url}")
-                self.logger.debug(f"Request Data: {json.dumps(masked_request, indent=2)}")
+                if debug_enabled:
+                    self.logger.debug(f"Request URL: {url}")
+                    self.logger.debug(f"Request Data: {orjson.dumps(masked_request).decode()}")
             else:
                 self.logger.info(f"API Request Retry {attempt}/{max_retries}: {method} - ID: {self.request_id-1}")
             
@@ -145,11 +160,14 @@ class ZabbixClient:
                     raise ZabbixAPIError(error_msg)
                 
                 # Log successful response (mask sensitive data)
-                masked_result = self._mask_sensitive_data(result)
-                self.logger.debug(f"Response Data: {json.dumps(masked_result, indent=2)}")
-                
-                # Log to access log
-                self.access_logger.info(f"API Call: {method} - ID: {self.request_id-1} - Params: {json.dumps(masked_request['params'])} - Result: {json.dumps(masked_result)}")
+                if debug_enabled or access_enabled:
+                    masked_result_json = orjson.dumps(self._mask_sensitive_data(result)).decode()
+                    if debug_enabled:
+                        self.logger.debug(f"Response Data: {masked_result_json}")
+                    
+                    # Log to access log
+                    if access_enabled:
+                        self.access_logger.info(f"API Call: {method} - ID: {self.request_id-1} - Params: {orjson.dumps(masked_request['params']).decode()} - Result: {masked_result_json}")
                 
                 return result.get("result", {})
                 